@@ -1,52 +1,95 @@
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse, HTMLResponse, FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import StreamingResponse, HTMLResponse, FileResponse, Response
 from fastapi.staticfiles import StaticFiles
 import os
-import shutil
+import codecs
+import logging
 import uuid
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+import aiofiles
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
-from .validator_engine import ValidatorEngine
-from .services.column_mapper import ColumnMapper
-from .services.root_cause_engine import RootCauseEngine
-from .services.fix_suggestion_engine import FixSuggestionEngine
+# Engine diagnostics are logged at DEBUG; set LOG_LEVEL=DEBUG to see file-loading/mapping details
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "WARNING").upper())
+logger = logging.getLogger(__name__)
+
+from .validation_pipeline import DataLoadError, init_worker, run_validation_pipeline
 from .services.gemini_assistant import GeminiAssistant
 from .services.report_generator import ReportGenerator
 from .services.auth import verify_credentials, create_access_token, get_current_user, ACCESS_TOKEN_EXPIRE_MINUTES
-from .services.session_db import store_session, delete_session, get_session
+from .services.session_db import store_session, delete_session, start_cleanup_scheduler
+from .services.serialization import dumps_json, loads_json, convert_numpy_types
+from .services.session_store import create_session_store
 from typing import Optional
-import json
-from io import BytesIO
+from io import StringIO
 from pathlib import Path
-import numpy as np
 import pandas as pd
 
-def convert_numpy_types(obj):
-    """Convert numpy types to native Python types for JSON serialization."""
-    if isinstance(obj, dict):
-        return {k: convert_numpy_types(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_numpy_types(item) for item in obj]
-    elif isinstance(obj, (np.integer, np.int64, np.int32)):
-        return int(obj)
-    elif isinstance(obj, (np.floating, np.float64, np.float32)):
-        return float(obj)
-    elif isinstance(obj, np.bool_):
-        return bool(obj)
-    elif isinstance(obj, np.ndarray):
-        return obj.tolist()
-    elif pd.isna(obj):
-        return None
-    return obj
+def json_response(obj) -> Response:
+    """Return validation payloads as JSON without FastAPI's jsonable_encoder pass."""
+    return Response(content=dumps_json(obj), media_type="application/json")
+
+# Worker processes for validation runs. forkserver workers start from a clean interpreter and only
+# import the pipeline module, so they never inherit sqlite connections or the cleanup timer
+VALIDATION_WORKERS = int(os.getenv("VALIDATION_WORKERS", os.cpu_count() or 1))
+_validation_pool: Optional[ProcessPoolExecutor] = None
+
+def _new_validation_pool() -> ProcessPoolExecutor:
+    """Build the validation pool (also used to replace a broken one)."""
+    return ProcessPoolExecutor(
+        max_workers=VALIDATION_WORKERS,
+        mp_context=multiprocessing.get_context("forkserver"),
+        initializer=init_worker
+    )
+
+async def run_in_validation_pool(func, *args):
+    """Run a CPU-bound function in the validation process pool without blocking the event loop."""
+    global _validation_pool
+    pool = _validation_pool
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(pool, func, *args)
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM-killed); replace the pool so later requests still run
+        logger.error("Validation worker crashed; restarting the process pool")
+        if _validation_pool is pool:
+            _validation_pool = _new_validation_pool()
+            pool.shutdown(wait=False)
+        raise HTTPException(status_code=503, detail="Validation worker crashed. Please try again.")
+
+# Shared Gemini client (created on first AI request, then reused)
+_ai_assistant: Optional[GeminiAssistant] = None
+
+def get_ai_assistant() -> GeminiAssistant:
+    """Return the process-wide GeminiAssistant, creating it on first use."""
+    global _ai_assistant
+    if _ai_assistant is None:
+        _ai_assistant = GeminiAssistant()
+    return _ai_assistant
 
 # Resolve frontend build path
 FRONTEND_BUILD = Path(__file__).resolve().parent.parent.parent / "frontend" / "dist"
 
-app = FastAPI(title="Advanced AI Data Validator")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Own the validation pool for the lifetime of the server process."""
+    global _validation_pool
+    _validation_pool = _new_validation_pool()
+    try:
+        yield
+    finally:
+        _validation_pool.shutdown(wait=False, cancel_futures=True)
+
+app = FastAPI(title="Advanced AI Data Validator", lifespan=lifespan)
 
 # Enable CORS for React frontend
 app.add_middleware(
@@ -56,11 +99,67 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON results and HTML reports (highly compressible text)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 UPLOAD_DIR = "temp_uploads"
-os.makedirs(UPLOAD_DIR, exist_ok=True)
+UPLOAD_ROOT = Path(UPLOAD_DIR)
+UPLOAD_ROOT.mkdir(parents=True, exist_ok=True)
+
+# Uploads are written to disk in fixed-size chunks so peak memory stays flat
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MB
+
+def file_extension(filename: str, default: str = 'csv') -> str:
+    """Lower-cased extension of a file name (single pass, no list allocation)."""
+    base, dot, ext = filename.rpartition('.')
+    return ext.lower() if dot else default
+
+async def save_upload(upload: UploadFile, path: str):
+    """Stream an uploaded file to disk chunk by chunk instead of buffering it whole."""
+    async with aiofiles.open(path, "wb") as buffer:
+        while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+            await buffer.write(chunk)
+
+# Only the head of a CSV is needed to preview its columns
+PREVIEW_SAMPLE_BYTES = 64 * 1024
+PREVIEW_ENCODINGS = ['utf-8', 'latin-1', 'iso-8859-1', 'cp1252', 'utf-16', 'utf-8-sig']
+
+def read_preview_text(path: str) -> Optional[str]:
+    """Read and decode the first PREVIEW_SAMPLE_BYTES of a CSV in a single pass."""
+    with open(path, "rb") as f:
+        sample = f.read(PREVIEW_SAMPLE_BYTES + 1)
+    
+    truncated = len(sample) > PREVIEW_SAMPLE_BYTES
+    
+    # BOM-marked files decode unambiguously
+    if sample.startswith(codecs.BOM_UTF8):
+        encodings = ['utf-8-sig']
+    elif sample.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        encodings = ['utf-16']
+    else:
+        encodings = PREVIEW_ENCODINGS
+    
+    for encoding in encodings:
+        try:
+            # Non-final decode so a character cut at the sample boundary isn't an error
+            text = codecs.getincrementaldecoder(encoding)().decode(sample, final=not truncated)
+        except UnicodeDecodeError:
+            continue
+        if truncated:
+            # Drop the trailing partial line
+            text = text[:text.rfind("\n") + 1] or text
+        return text
+    return None
+
+# Column-name normalization helpers for the mapping preview
+COLUMN_NAME_SEPARATORS = str.maketrans({'_': ' ', '-': ' '})
+NUMERIC_DTYPES = {'int64', 'float64', 'int32', 'float32'}
 
-# In-memory store for demo (should use a database/cache for production)
-validation_sessions = {}
+# Validation results per session (in-memory LRU or Redis, see SESSION_BACKEND)
+validation_sessions = create_session_store()
+
+# Purge expired login sessions in the background, not on the auth path
+start_cleanup_scheduler()
 
 # ==================== AUTH ENDPOINTS ====================
 from datetime import datetime, timedelta
@@ -128,53 +227,32 @@ async def upload_files(
     threshold: float = Form(3.0)
 ):
     session_id = str(uuid.uuid4())
-    session_dir = os.path.join(UPLOAD_DIR, session_id)
-    os.makedirs(session_dir, exist_ok=True)
-    
-    gold_ext = gold_file.filename.lower().split('.')[-1] if '.' in gold_file.filename else 'csv'
-    growth_ext = growth_file.filename.lower().split('.')[-1] if '.' in growth_file.filename else 'csv'
+    session_dir = UPLOAD_ROOT / session_id
+    session_dir.mkdir(parents=True, exist_ok=True)
     
-    gold_path = os.path.join(session_dir, f"gold.{gold_ext}")
-    growth_path = os.path.join(session_dir, f"growth.{growth_ext}")
+    gold_path = str(session_dir / f"gold.{file_extension(gold_file.filename)}")
+    growth_path = str(session_dir / f"growth.{file_extension(growth_file.filename)}")
     
-    with open(gold_path, "wb") as buffer:
-        shutil.copyfileobj(gold_file.file, buffer)
-    with open(growth_path, "wb") as buffer:
-        shutil.copyfileobj(growth_file.file, buffer)
+    await save_upload(gold_file, gold_path)
+    await save_upload(growth_file, growth_path)
         
-    # Initialize Validator Engine
+    # Run the CPU-bound pipeline in a worker process so the event loop stays free
     try:
-        engine = ValidatorEngine(threshold_percent=threshold)
-        engine.load_data(growth_path, gold_path)  # Note: growth is CSV, gold is Fabric
-    except Exception as e:
+        outcome = await run_in_validation_pool(run_validation_pipeline, growth_path, gold_path, threshold)
+    except DataLoadError as e:
         # Return specific error to frontend
         raise HTTPException(status_code=400, detail=str(e))
     
-    # PHASE 3: Column Mapping
-    mapper = ColumnMapper(engine.csv_df, engine.fabric_df)
-    column_mappings = mapper.auto_map()
-    mapping_warnings = mapper.validate_mapping(column_mappings)
-    
-    import time
-    start_time = time.time()
-    
-    # Run validation
-    results = engine.validate_all()
-    summary = engine.get_summary_stats()
-    
-    # PHASE 6: Root Cause Analysis
-    root_cause_engine = RootCauseEngine(engine.csv_df, engine.fabric_df)
-    root_causes = root_cause_engine.analyze(results)
-    
-    # PHASE 7: Fix Suggestions
-    fixes = FixSuggestionEngine.generate_fixes(root_causes)
-    
-    duration = time.time() - start_time
-    print(f"⏱️ Validation completed in {duration:.2f}s")
+    summary = outcome["summary"]
+    results = outcome["results"]
+    column_mappings = outcome["column_mappings"]
+    mapping_warnings = outcome["mapping_warnings"]
+    root_causes = outcome["root_causes"]
+    fixes = outcome["fixes"]
     
     # Store in memory for later access (AI summary removed from here)
-    validation_sessions[session_id] = {
-        "engine": engine,
+    validation_sessions.set(session_id, {
+        "threshold": threshold,
         "summary": summary,
         "results": results,
         "column_mappings": column_mappings,
@@ -182,7 +260,7 @@ async def upload_files(
         "root_causes": root_causes,
         "fixes": fixes,
         "ai_summary": None # Lazy load this
-    }
+    })
     
     return {
         "session_id": session_id,
@@ -200,47 +278,44 @@ async def preview_columns(
     import pandas as pd
     
     session_id = str(uuid.uuid4())
-    session_dir = os.path.join(UPLOAD_DIR, session_id)
-    os.makedirs(session_dir, exist_ok=True)
+    session_dir = UPLOAD_ROOT / session_id
+    session_dir.mkdir(parents=True, exist_ok=True)
     
     # Save files temporarily
-    gold_path = os.path.join(session_dir, gold_file.filename)
-    growth_path = os.path.join(session_dir, growth_file.filename)
+    gold_path = str(session_dir / gold_file.filename)
+    growth_path = str(session_dir / growth_file.filename)
     
-    with open(gold_path, "wb") as f:
-        f.write(await gold_file.read())
-    with open(growth_path, "wb") as f:
-        f.write(await growth_file.read())
+    await save_upload(gold_file, gold_path)
+    await save_upload(growth_file, growth_path)
     
     # Robust file reader that handles various formats and encodings
     def read_file(path):
-        import pandas as pd
-        file_ext = path.lower().split('.')[-1]
+        file_ext = file_extension(path)
         
-        # Excel files
+        # Excel files - open the workbook once and probe header rows against it
         if file_ext in ['xlsx', 'xls']:
             try:
-                # Try reading with different header rows
-                for skiprows in [0, 1, 2, 3]:
-                    try:
-                        df = pd.read_excel(path, skiprows=skiprows, nrows=15)
-                        # Check if we have valid column names
-                        if not any(str(c).startswith('Unnamed') for c in df.columns[:3]):
-                            return df.head(10)
-                    except:
-                        continue
-                return pd.read_excel(path, nrows=10)
+                with pd.ExcelFile(path, engine='calamine') as excel_file:
+                    # Try reading with different header rows
+                    for skiprows in [0, 1, 2, 3]:
+                        try:
+                            df = excel_file.parse(skiprows=skiprows, nrows=15)
+                            # Check if we have valid column names
+                            if not any(str(c).startswith('Unnamed') for c in df.columns[:3]):
+                                return df.head(10)
+                        except:
+                            continue
+                    return excel_file.parse(nrows=10)
             except Exception as e:
                 print(f"Excel read error: {e}")
                 return pd.DataFrame()
         
-        # CSV files - try multiple encodings and skip rows
-        encodings = ['utf-8', 'latin-1', 'iso-8859-1', 'cp1252', 'utf-16', 'utf-8-sig']
-        
-        for encoding in encodings:
+        # CSV files - read the head of the file once, then probe skiprows in memory
+        text = read_preview_text(path)
+        if text is not None:
             for skiprows in [0, 1, 2, 3]:
                 try:
-                    df = pd.read_csv(path, encoding=encoding, skiprows=skiprows, nrows=15, on_bad_lines='skip')
+                    df = pd.read_csv(StringIO(text), skiprows=skiprows, nrows=15, on_bad_lines='skip')
                     # Check if columns look valid (not Unnamed or empty)
                     if len(df.columns) > 0:
                         unnamed_count = sum(1 for c in df.columns if str(c).startswith('Unnamed') or str(c).strip() == '')
@@ -263,16 +338,20 @@ async def preview_columns(
     
     # Extract column info with sample data - filter out Unnamed columns
     def get_column_info(df):
+        # Convert the whole preview frame once, then slice per column (no per-column Series copies)
+        not_null = df.notna().to_numpy()
+        as_text = df.astype(str).to_numpy(dtype=object)
+        
         cols = []
-        for col in df.columns:
+        for i, (col, dtype) in enumerate(zip(df.columns, df.dtypes)):
             # Skip Unnamed columns and empty column names
             col_str = str(col).strip()
             if col_str.startswith('Unnamed') or col_str == '' or col_str.lower() == 'nan':
                 continue
-            sample = df[col].dropna().head(3).astype(str).tolist()
+            sample = as_text[not_null[:, i], i][:3].tolist()
             cols.append({
                 "name": col,
-                "dtype": str(df[col].dtype),
+                "dtype": str(dtype),
                 "sample": sample
             })
         return cols
@@ -288,32 +367,30 @@ async def preview_columns(
     
     # Helper to normalize column names for comparison
     def normalize_name(name):
-        return str(name).lower().replace('_', ' ').replace('-', ' ').strip()
-    
-    # Helper to check similarity
-    def is_similar(name1, name2):
-        n1, n2 = normalize_name(name1), normalize_name(name2)
-        # Exact match
-        if n1 == n2:
-            return True
-        # One contains the other
-        if n1 in n2 or n2 in n1:
-            return True
-        # Common keywords match
-        words1 = set(n1.split())
-        words2 = set(n2.split())
-        common = words1 & words2
-        if common and len(common) >= 1:
-            return True
-        return False
+        return str(name).lower().translate(COLUMN_NAME_SEPARATORS).strip()
+    
+    # Normalize every column and split it into tokens once, not per pair
+    def prepare(columns):
+        prepared = []
+        for col in columns:
+            normalized = normalize_name(col['name'])
+            prepared.append((col, normalized, frozenset(normalized.split())))
+        return prepared
+    
+    gold_prepared = prepare(gold_columns)
+    growth_prepared = prepare(growth_columns)
+    
+    # Similar = one name contains the other (covers exact) or they share a keyword
+    def is_similar(n1, words1, n2, words2):
+        return n1 in n2 or n2 in n1 or not words1.isdisjoint(words2)
     
     # First pass: Find matching columns between both files
-    for gc in gold_columns:
-        for grc in growth_columns:
-            if is_similar(gc['name'], grc['name']):
+    for gc, g_norm, g_words in gold_prepared:
+        for grc, gr_norm, gr_words in growth_prepared:
+            if is_similar(g_norm, g_words, gr_norm, gr_words):
                 if gc['name'] not in matched_gold and grc['name'] not in matched_growth:
                     # Use the growth column name as the target (more readable usually)
-                    target_name = normalize_name(grc['name']).replace(' ', '_')
+                    target_name = gr_norm.replace(' ', '_')
                     suggested_mappings.append({
                         "target": target_name,
                         "gold_column": gc['name'],
@@ -325,9 +402,9 @@ async def preview_columns(
                     break
     
     # Second pass: Add unmatched columns that might still be useful (numeric only for validation)
-    for gc in gold_columns:
-        if gc['name'] not in matched_gold and gc['dtype'] in ['int64', 'float64', 'int32', 'float32']:
-            target_name = normalize_name(gc['name']).replace(' ', '_')
+    for gc, g_norm, _ in gold_prepared:
+        if gc['name'] not in matched_gold and gc['dtype'] in NUMERIC_DTYPES:
+            target_name = g_norm.replace(' ', '_')
             suggested_mappings.append({
                 "target": target_name,
                 "gold_column": gc['name'],
@@ -335,18 +412,19 @@ async def preview_columns(
                 "auto_matched": False
             })
     
-    for grc in growth_columns:
-        if grc['name'] not in matched_growth and grc['dtype'] in ['int64', 'float64', 'int32', 'float32']:
-            target_name = normalize_name(grc['name']).replace(' ', '_')
+    existing_targets = {m['target'] for m in suggested_mappings}
+    for grc, gr_norm, _ in growth_prepared:
+        if grc['name'] not in matched_growth and grc['dtype'] in NUMERIC_DTYPES:
+            target_name = gr_norm.replace(' ', '_')
             # Check if target already exists
-            existing = next((m for m in suggested_mappings if m['target'] == target_name), None)
-            if not existing:
+            if target_name not in existing_targets:
                 suggested_mappings.append({
                     "target": target_name,
                     "gold_column": None,
                     "growth_column": grc['name'],
                     "auto_matched": False
                 })
+                existing_targets.add(target_name)
     
     return {
         "session_id": session_id,
@@ -367,11 +445,9 @@ async def validate_with_mappings(
     threshold: float = Form(3.0)
 ):
     """Run validation with custom column mappings for both files."""
-    import json
-    
     # Parse column mappings
-    growth_col_mappings = json.loads(growth_mappings)
-    gold_col_mappings = json.loads(gold_mappings)
+    growth_col_mappings = loads_json(growth_mappings)
+    gold_col_mappings = loads_json(gold_mappings)
     
     # Debug: log received mappings
     print("\n" + "="*60)
@@ -380,28 +456,23 @@ async def validate_with_mappings(
     print(f"   Gold mappings: {gold_col_mappings}")
     print("="*60 + "\n")
     
-    # Initialize validation engine with custom mappings for both files
-    engine = ValidatorEngine(
-        threshold_percent=threshold, 
-        custom_column_mappings=growth_col_mappings,
-        gold_column_mappings=gold_col_mappings
-    )
-    engine.load_data(growth_path, gold_path)  # growth is CSV, gold is Fabric
-    
-    # Run validation
-    results = engine.validate_all()
-    summary = engine.get_summary_stats()
-    
-    # Root cause analysis
-    root_cause_engine = RootCauseEngine(engine.csv_df, engine.fabric_df)
-    root_causes = root_cause_engine.analyze(results)
+    # Run the CPU-bound pipeline in a worker process so the event loop stays free
+    try:
+        outcome = await run_in_validation_pool(
+            run_validation_pipeline, growth_path, gold_path, threshold,
+            growth_col_mappings, gold_col_mappings
+        )
+    except DataLoadError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    # Fix suggestions
-    fixes = FixSuggestionEngine.generate_fixes(root_causes)
+    summary = outcome["summary"]
+    results = outcome["results"]
+    root_causes = outcome["root_causes"]
+    fixes = outcome["fixes"]
     
     # Store session
-    validation_sessions[session_id] = {
-        "engine": engine,
+    validation_sessions.set(session_id, {
+        "threshold": threshold,
         "summary": summary,
         "results": results,
         "column_mappings": {"growth": growth_col_mappings, "gold": gold_col_mappings},
@@ -409,7 +480,7 @@ async def validate_with_mappings(
         "root_causes": root_causes,
         "fixes": fixes,
         "ai_summary": None
-    }
+    })
     
     return {
         "session_id": session_id,
@@ -419,11 +490,10 @@ async def validate_with_mappings(
 
 @app.get("/results/{session_id}")
 async def get_results(session_id: str):
-    if session_id not in validation_sessions:
+    session = validation_sessions.get(session_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
-    
-    session = validation_sessions[session_id]
-    return convert_numpy_types({
+    return json_response({
         "results": session["results"],
         "root_causes": session.get("root_causes", []),
         "fixes": session.get("fixes", [])
@@ -437,7 +507,7 @@ async def filter_results(
     end_date: Optional[str] = None,
     status: Optional[str] = None # 'PASS' or 'FAIL'
 ):
-    if session_id not in validation_sessions:
+    if validation_sessions.get(session_id) is None:
         return {"error": "Session not found"}
     
     # Logic to filter the DataFrames and rerun validation or filter existing dicts
@@ -448,16 +518,15 @@ async def filter_results(
 
 @app.get("/results/{session_id}/ai-insight")
 async def get_ai_insight(session_id: str):
-    if session_id not in validation_sessions:
+    session = validation_sessions.get(session_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    session = validation_sessions[session_id]
-    
     # Lazy generation of AI summary
     if session.get("ai_summary") is None:
         try:
             print(f"🤖 Generating AI summary for session {session_id}...")
-            ai_assistant = GeminiAssistant()
+            ai_assistant = get_ai_assistant()
             ai_summary = ai_assistant.generate_summary(
                 {"summary": session["summary"], "results": session["results"]},
                 session.get("root_causes", []),
@@ -466,6 +535,7 @@ async def get_ai_insight(session_id: str):
             session["ai_summary"] = ai_summary
         except Exception as e:
             session["ai_summary"] = f"AI summary unavailable: {str(e)}"
+        validation_sessions.set(session_id, session)
     
     return {
         "summary": session.get("ai_summary", "AI summary not available"),
@@ -473,13 +543,49 @@ async def get_ai_insight(session_id: str):
         "fixes": session.get("fixes", [])
     }
 
+@app.get("/results/{session_id}/ai-insight/stream")
+async def stream_ai_insight(session_id: str):
+    """Stream the AI summary as plain text while Gemini generates it."""
+    session = validation_sessions.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+    
+    def generate():
+        # Already generated - replay the cached summary
+        if session.get("ai_summary") is not None:
+            yield session["ai_summary"]
+            return
+        
+        chunks = []
+        try:
+            print(f"🤖 Streaming AI summary for session {session_id}...")
+            ai_assistant = get_ai_assistant()
+            for chunk in ai_assistant.generate_summary_stream(
+                {"summary": session["summary"], "results": session["results"]},
+                session.get("root_causes", []),
+                session.get("fixes", [])
+            ):
+                chunks.append(chunk)
+                yield chunk
+        except Exception as e:
+            print(f"❌ AI summary stream error: {str(e)}")
+            if chunks:
+                return
+            chunks = [f"AI summary unavailable: {str(e)}"]
+            yield chunks[0]
+        
+        # Cache the full text so /ai-insight and reports reuse it
+        session["ai_summary"] = "".join(chunks)
+        validation_sessions.set(session_id, session)
+    
+    return StreamingResponse(generate(), media_type="text/plain; charset=utf-8")
+
 @app.post("/results/{session_id}/chat")
 async def chat_with_ai(session_id: str, question: dict):
     """Interactive chat with Gemini about validation results."""
-    if session_id not in validation_sessions:
+    session = validation_sessions.get(session_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
-    
-    session = validation_sessions[session_id]
     user_question = question.get("question", "")
     
     if not user_question:
@@ -492,7 +598,7 @@ async def chat_with_ai(session_id: str, question: dict):
             "results": session["results"]
         })
         
-        ai_assistant = GeminiAssistant()
+        ai_assistant = get_ai_assistant()
         answer = ai_assistant.answer_question(user_question, context)
         return {"answer": answer}
     except Exception as e:
@@ -501,19 +607,42 @@ async def chat_with_ai(session_id: str, question: dict):
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"AI error: {str(e)}")
 
+@app.post("/results/{session_id}/chat/batch")
+async def batch_chat_with_ai(session_id: str, payload: dict):
+    """Ask Gemini several questions about validation results in one call."""
+    session = validation_sessions.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+    questions = [q for q in payload.get("questions", []) if q]
+    
+    if not questions:
+        raise HTTPException(status_code=400, detail="Questions are required")
+    
+    try:
+        context = convert_numpy_types({
+            "summary": session["summary"], 
+            "results": session["results"]
+        })
+        
+        ai_assistant = get_ai_assistant()
+        answers = ai_assistant.batch_answer(questions, context)
+        return {"answers": [{"question": q, "answer": a} for q, a in zip(questions, answers)]}
+    except Exception as e:
+        print(f"❌ Batch chat AI error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"AI error: {str(e)}")
+
 @app.get("/results/{session_id}/export/html")
 async def export_html_report(session_id: str):
     """Generate and download a comprehensive HTML report."""
-    if session_id not in validation_sessions:
+    session = validation_sessions.get(session_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    session = validation_sessions[session_id]
-    
     # Generate HTML report
     html_content = ReportGenerator.generate_html_report(
         validation_results=session["results"],
         summary=session["summary"],
-        threshold=session["engine"].threshold_percent
+        threshold=session["threshold"]
     )
     
     # Return as downloadable file
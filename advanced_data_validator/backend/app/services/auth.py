@@ -3,9 +3,13 @@ Authentication service for JWT token management and user verification.
 Uses bcrypt for secure password hashing.
 """
 import os
+import hashlib
+import functools
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Optional
-from jose import JWTError, jwt
+import jwt
+from jwt import InvalidTokenError as JWTError
 from passlib.context import CryptContext
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
@@ -32,58 +36,61 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+# Successful bcrypt verifications, keyed by (hash, sha256(password)).
+# Repeat logins skip the KDF; a changed hash in .env never matches old entries.
+VERIFY_CACHE_SIZE = 1024
+_verify_cache: "OrderedDict[tuple, bool]" = OrderedDict()
+
+
+def verify_password_cached(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password, reusing earlier successful bcrypt checks for the same hash."""
+    key = (hashed_password, hashlib.sha256(plain_password.encode()).digest())
+    if key in _verify_cache:
+        _verify_cache.move_to_end(key)
+        return True
+    
+    if not verify_password(plain_password, hashed_password):
+        # Failures are never cached so guessing always pays the full bcrypt cost
+        return False
+    
+    _verify_cache[key] = True
+    if len(_verify_cache) > VERIFY_CACHE_SIZE:
+        _verify_cache.popitem(last=False)
+    return True
+
+
 # Pre-hashed passwords for the two users
 # These are bcrypt hashes of the passwords
 # admin123 -> hashed | valid123 -> hashed
+@functools.cache
 def get_valid_users():
-    """Get valid users from environment variables with bcrypt hashed passwords."""
+    """
+    Get valid users from environment variables with bcrypt hashed passwords.
+    Users configured with only a plain password are hashed here, once, on first login
+    (not at import, so a broken bcrypt backend can't stop the app from starting).
+    Cached per process; call get_valid_users.cache_clear() to reload the environment.
+    """
     users = {}
     
-    # User 1
-    user1_username = os.getenv("AUTH_USER1_USERNAME", "admin")
-    user1_password_hash = os.getenv("AUTH_USER1_PASSWORD_HASH")
-    user1_password_plain = os.getenv("AUTH_USER1_PASSWORD", "admin123")
-    
-    if user1_username:
-        # Use hash if available, otherwise verify against plain (for backward compatibility)
-        users[user1_username] = {
-            "hash": user1_password_hash,
-            "plain": user1_password_plain if not user1_password_hash else None
-        }
-    
-    # User 2
-    user2_username = os.getenv("AUTH_USER2_USERNAME", "validator")
-    user2_password_hash = os.getenv("AUTH_USER2_PASSWORD_HASH")
-    user2_password_plain = os.getenv("AUTH_USER2_PASSWORD", "valid123")
-    
-    if user2_username:
-        users[user2_username] = {
-            "hash": user2_password_hash,
-            "plain": user2_password_plain if not user2_password_hash else None
-        }
+    for prefix, default_username, default_password in [
+        ("AUTH_USER1", "admin", "admin123"),
+        ("AUTH_USER2", "validator", "valid123"),
+    ]:
+        username = os.getenv(f"{prefix}_USERNAME", default_username)
+        password_hash = os.getenv(f"{prefix}_PASSWORD_HASH")
+        password_plain = os.getenv(f"{prefix}_PASSWORD", default_password)
+        
+        if username and (password_hash or password_plain):
+            # Prefer the configured hash; otherwise hash the plain password (backward compatibility)
+            users[username] = password_hash or hash_password(password_plain)
     
     return users
 
 
 def verify_credentials(username: str, password: str) -> bool:
     """Verify username and password using bcrypt hashing."""
-    valid_users = get_valid_users()
-    
-    if username not in valid_users:
-        return False
-    
-    user_data = valid_users[username]
-    
-    # If hash is available, use secure bcrypt verification
-    if user_data["hash"]:
-        return verify_password(password, user_data["hash"])
-    
-    # Fallback to plain text comparison (for backward compatibility)
-    # This should only be used during migration
-    if user_data["plain"]:
-        return user_data["plain"] == password
-    
-    return False
+    password_hash = get_valid_users().get(username)
+    return password_hash is not None and verify_password_cached(password, password_hash)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -122,10 +129,19 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
     """
     token = credentials.credentials
     
+    # Verify the token first - pure CPU, so forged/expired tokens never reach the database
+    payload = verify_token(token)
+    if payload is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
     # Import here to avoid circular imports
     from .session_db import get_session
     
-    # Check if session exists in database
+    # Single DB hit: the session row is what logout revokes, shared by all workers
     session = get_session(token)
     if not session:
         raise HTTPException(
@@ -134,15 +150,6 @@ async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(s
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Verify the token
-    payload = verify_token(token)
-    if payload is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid authentication credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
     return {"username": payload.get("sub"), "token": token}
 
 
@@ -1,7 +1,41 @@
-from fuzzywuzzy import fuzz
+from rapidfuzz import fuzz, process
+from functools import lru_cache
 from typing import Dict, List, Tuple
+import re
+import numpy as np
 import pandas as pd
 
+# Keyword groups for semantic matching, checked in order
+SEMANTIC_KEYWORDS = {
+    'cost': ['spend', 'cost', 'amount', 'cpc'],
+    'impressions': ['impressions', 'impr', 'views'],
+    'clicks': ['clicks', 'click'],
+    'campaign': ['campaign', 'camp', 'campaign_name'],
+    'date': ['date', 'day', 'timestamp', 'dt']
+}
+
+# One compiled alternation per group: a single C-level scan instead of a Python any() loop
+SEMANTIC_PATTERNS = {
+    key: re.compile('|'.join(map(re.escape, variants)))
+    for key, variants in SEMANTIC_KEYWORDS.items()
+}
+
+
+@lru_cache(maxsize=128)
+def _ratio_matrix(growth_names: Tuple[str, ...], fabric_names: Tuple[str, ...], threshold: int = 0) -> np.ndarray:
+    """
+    Fuzzy ratio for every growth x fabric name pair, rounded like fuzzywuzzy's ints.
+    Pairs that can't round up to the threshold come back as 0, which lets rapidfuzz
+    bail out of those comparisons early.
+    Memoized so re-validating files with the same schema skips the scoring entirely.
+    """
+    score_cutoff = max(threshold - 0.5, 0)
+    scores = process.cdist(growth_names, fabric_names, scorer=fuzz.ratio, score_cutoff=score_cutoff, workers=-1)
+    scores = np.rint(scores).astype(int)
+    scores.setflags(write=False)  # shared between calls
+    return scores
+
+
 class ColumnMapper:
     """
     Automatically maps columns between Growth and Fabric Gold datasets
@@ -14,6 +48,26 @@ class ColumnMapper:
         self.growth_df = growth_df
         self.fabric_df = fabric_df
         
+        # Lowercase every column name once; comparisons never call .lower() again
+        self._growth_cols_lower = [c.lower() for c in self.growth_cols]
+        self._fabric_cols_lower = [c.lower() for c in self.fabric_cols]
+        
+        # Case-insensitive exact-match lookup (first fabric column wins on collisions)
+        self._fabric_lower = {}
+        for f_col, f_lower in zip(self.fabric_cols, self._fabric_cols_lower):
+            self._fabric_lower.setdefault(f_lower, f_col)
+        
+        # Dtype names per column, stringified once
+        self._growth_dtype_str = dict(zip(growth_df.columns, growth_df.dtypes.astype(str)))
+        self._fabric_dtype_str = dict(zip(fabric_df.columns, fabric_df.dtypes.astype(str)))
+        
+        # Per-column numeric flags for validate_mapping
+        self._growth_numeric = growth_df.dtypes.map(pd.api.types.is_numeric_dtype)
+        self._fabric_numeric = fabric_df.dtypes.map(pd.api.types.is_numeric_dtype)
+        
+        # Semantic key -> first fabric column carrying one of its keywords
+        self._fabric_semantic = self._semantic_index(self.fabric_cols)
+        
     def auto_map(self, threshold: int = 70) -> Dict[str, Dict]:
         """
         Automatically map columns with confidence scores.
@@ -28,25 +82,39 @@ class ColumnMapper:
             }
         """
         mappings = {}
+        if not self.growth_cols or not self.fabric_cols:
+            return mappings
+        
+        growth_lower = self._growth_cols_lower
+        fabric_lower = self._fabric_cols_lower
+        
+        # Exact matches are a dict lookup - only the rest need fuzzy scoring
+        exact = [self._fabric_lower.get(g) for g in growth_lower]
+        fuzzy_rows = [i for i, match in enumerate(exact) if match is None]
+        
+        # Score matrix for the non-exact columns in one (cached) C++ call
+        scores = None
+        if fuzzy_rows:
+            scores = _ratio_matrix(tuple(growth_lower[i] for i in fuzzy_rows), tuple(fabric_lower), threshold)
+        score_row = {i: row for row, i in enumerate(fuzzy_rows)}
         
-        for g_col in self.growth_cols:
+        for i, g_col in enumerate(self.growth_cols):
             best_match = None
             best_score = 0
             method = None
             
-            for f_col in self.fabric_cols:
-                # Exact match
-                if g_col.lower() == f_col.lower():
-                    best_match = f_col
-                    best_score = 100
-                    method = 'exact'
-                    break
-                
-                # Fuzzy match
-                score = fuzz.ratio(g_col.lower(), f_col.lower())
-                if score > best_score and score >= threshold:
-                    best_match = f_col
-                    best_score = score
+            # Exact match
+            if exact[i] is not None:
+                best_match = exact[i]
+                best_score = 100
+                method = 'exact'
+            else:
+                # Fuzzy match - first best-scoring candidate at or above the threshold
+                row = scores[score_row[i]]
+                j = int(np.argmax(row))
+                if row[j] > 0 and row[j] >= threshold:
+                    best_match = self.fabric_cols[j]
+                    best_score = int(row[j])
                     method = 'fuzzy'
             
             # Semantic matching for common variations
@@ -62,42 +130,53 @@ class ColumnMapper:
                     'mapped_to': best_match,
                     'confidence': best_score,
                     'method': method,
-                    'growth_type': str(self.growth_df[g_col].dtype),
-                    'fabric_type': str(self.fabric_df[best_match].dtype)
+                    'growth_type': self._growth_dtype_str[g_col],
+                    'fabric_type': self._fabric_dtype_str[best_match]
                 }
         
         return mappings
     
     def _semantic_match(self, col: str, candidates: List[str]) -> Tuple[int, str]:
         """Match based on semantic keywords."""
-        keywords = {
-            'cost': ['spend', 'cost', 'amount', 'cpc'],
-            'impressions': ['impressions', 'impr', 'views'],
-            'clicks': ['clicks', 'click'],
-            'campaign': ['campaign', 'camp', 'campaign_name'],
-            'date': ['date', 'day', 'timestamp', 'dt']
-        }
+        if candidates is self.fabric_cols:
+            index = self._fabric_semantic
+        else:
+            index = self._semantic_index(candidates)
         
         col_lower = col.lower()
-        for key, variants in keywords.items():
-            if any(v in col_lower for v in variants):
-                for candidate in candidates:
-                    if any(v in candidate.lower() for v in variants):
-                        return (80, candidate)
+        for key, pattern in SEMANTIC_PATTERNS.items():
+            if key in index and pattern.search(col_lower):
+                return (80, index[key])
         
         return (0, None)
     
+    @staticmethod
+    def _semantic_index(candidates: List[str]) -> Dict[str, str]:
+        """Map each semantic key to the first candidate column containing one of its variants."""
+        index = {}
+        for candidate in candidates:
+            candidate_lower = candidate.lower()
+            for key, pattern in SEMANTIC_PATTERNS.items():
+                if key not in index and pattern.search(candidate_lower):
+                    index[key] = candidate
+        return index
+    
     def validate_mapping(self, mappings: Dict) -> Dict[str, str]:
         """Check if mapped columns have compatible data types."""
         warnings = {}
+        if not mappings:
+            return warnings
         
-        for g_col, mapping in mappings.items():
-            f_col = mapping['mapped_to']
-            g_type = self.growth_df[g_col].dtype
-            f_type = self.fabric_df[f_col].dtype
-            
-            # Numeric compatibility check
-            if pd.api.types.is_numeric_dtype(g_type) != pd.api.types.is_numeric_dtype(f_type):
-                warnings[g_col] = f"Type mismatch: {g_type} vs {f_type}"
+        g_cols = list(mappings.keys())
+        f_cols = [mapping['mapped_to'] for mapping in mappings.values()]
+        
+        # Numeric compatibility check - one aligned boolean comparison for all pairs
+        g_numeric = self._growth_numeric.loc[g_cols].to_numpy(dtype=bool)
+        f_numeric = self._fabric_numeric.loc[f_cols].to_numpy(dtype=bool)
+        
+        # Only the mismatching pairs need Python-level work
+        for k in np.flatnonzero(g_numeric != f_numeric):
+            g_col, f_col = g_cols[k], f_cols[k]
+            warnings[g_col] = f"Type mismatch: {self._growth_dtype_str[g_col]} vs {self._fabric_dtype_str[f_col]}"
         
         return warnings
@@ -1,5 +1,84 @@
 from typing import Dict, List
 
+# Fix templates are immutable, so build them once at import instead of per root cause
+_DUPLICATES_FIX = {
+    'pandas_fix': """# Remove duplicate rows from Growth CSV
+growth_df_clean = growth_df.drop_duplicates()
+print(f"Removed {len(growth_df) - len(growth_df_clean)} duplicates")""",
+    
+    'sql_equivalent': """-- In your source query, add DISTINCT
+SELECT DISTINCT 
+    campaign_name, day, cost, impressions, clicks
+FROM growth_marketing_source
+WHERE ...""",
+    
+    'prevention': "Add a DISTINCT clause to your extraction query, or implement deduplication in your ETL pipeline before loading to Growth CSV."
+}
+
+_GRAIN_MISMATCH_FIX = {
+    'pandas_fix': """# If Growth is more granular, aggregate to match Fabric
+growth_df_aggregated = growth_df.groupby(['campaign_name', 'day']).agg({
+    'cost': 'sum',
+    'impressions': 'sum',
+    'clicks': 'sum'
+}).reset_index()""",
+    
+    'sql_equivalent': """-- Ensure both sources use the same GROUP BY
+SELECT 
+    campaign_name, 
+    DATE(timestamp) as day,
+    SUM(cost) as cost,
+    SUM(impressions) as impressions,
+    SUM(clicks) as clicks
+FROM source
+GROUP BY campaign_name, DATE(timestamp)""",
+    
+    'prevention': "Standardize aggregation level in both pipelines. Document expected grain (e.g., campaign + date) in schema definitions."
+}
+
+_DATE_SHIFT_FIX = {
+    'pandas_fix': """# Normalize dates to UTC and same format
+growth_df['day'] = pd.to_datetime(growth_df['day']).dt.tz_localize(None).dt.date
+fabric_df['day'] = pd.to_datetime(fabric_df['day']).dt.tz_localize(None).dt.date""",
+    
+    'sql_equivalent': """-- Standardize timezone in queries
+DATE(timestamp AT TIME ZONE 'UTC') as day""",
+    
+    'prevention': "Always extract dates in UTC. Define timezone handling in data contract. Add validation checks in ETL for date consistency."
+}
+
+_MISSING_CAMPAIGNS_PANDAS = """# Filter to common campaigns only
+common_campaigns = pd.Index(growth_df['campaign_name']).intersection(fabric_df['campaign_name'])
+growth_df_filtered = growth_df[growth_df['campaign_name'].isin(common_campaigns)]
+fabric_df_filtered = fabric_df[fabric_df['campaign_name'].isin(common_campaigns)]
+
+# Missing campaigns to investigate:"""
+
+_MISSING_CAMPAIGNS_SQL = """-- Add campaign filter to align sources
+WHERE campaign_name IN (
+    SELECT campaign_name FROM growth_source
+    INTERSECT
+    SELECT campaign_name FROM fabric_source
+)"""
+
+_MISSING_CAMPAIGNS_PREVENTION = "Implement campaign naming standards. Add validation to reject campaigns not in master list. Sync campaign metadata between systems."
+
+_SYSTEMATIC_BIAS_PANDAS = """# Investigate filter or calculation differences
+# Check for:
+# 1. Different WHERE clauses
+# 2. Currency conversion issues
+# 3. Tax inclusion/exclusion
+# 4. Time window boundaries
+
+# Example debug:
+print("Growth date range:", growth_df['day'].min(), "to", growth_df['day'].max())
+print("Fabric date range:", fabric_df['day'].min(), "to", fabric_df['day'].max())"""
+
+_SYSTEMATIC_BIAS_SQL = """-- Audit both queries for systematic differences
+-- Compare: date filters, WHERE clauses, CASE statements, currency multipliers"""
+
+_SYSTEMATIC_BIAS_PREVENTION = "is consistently higher. Review source query logic, filters, and transformations. Ensure both use same business rules."
+
 class FixSuggestionEngine:
     """
     Generates actionable fix suggestions for each identified root cause.
@@ -29,20 +108,9 @@ class FixSuggestionEngine:
                 'description': cause['description']
             }
             
-            if cause['type'] == 'duplicate_records':
-                fix.update(FixSuggestionEngine._fix_duplicates(cause))
-            
-            elif cause['type'] == 'grain_mismatch':
-                fix.update(FixSuggestionEngine._fix_grain_mismatch(cause))
-            
-            elif cause['type'] == 'date_shift':
-                fix.update(FixSuggestionEngine._fix_date_shift(cause))
-            
-            elif cause['type'] == 'missing_campaigns':
-                fix.update(FixSuggestionEngine._fix_missing_campaigns(cause))
-            
-            elif cause['type'] == 'systematic_bias':
-                fix.update(FixSuggestionEngine._fix_systematic_bias(cause))
+            handler = FixSuggestionEngine._DISPATCH.get(cause['type'])
+            if handler:
+                fix.update(handler(cause))
             
             fixes.append(fix)
         
@@ -50,55 +118,15 @@ class FixSuggestionEngine:
     
     @staticmethod
     def _fix_duplicates(cause: Dict) -> Dict:
-        return {
-            'pandas_fix': """# Remove duplicate rows from Growth CSV
-growth_df_clean = growth_df.drop_duplicates()
-print(f"Removed {len(growth_df) - len(growth_df_clean)} duplicates")""",
-            
-            'sql_equivalent': """-- In your source query, add DISTINCT
-SELECT DISTINCT 
-    campaign_name, day, cost, impressions, clicks
-FROM growth_marketing_source
-WHERE ...""",
-            
-            'prevention': "Add a DISTINCT clause to your extraction query, or implement deduplication in your ETL pipeline before loading to Growth CSV."
-        }
+        return _DUPLICATES_FIX.copy()
     
     @staticmethod
     def _fix_grain_mismatch(cause: Dict) -> Dict:
-        return {
-            'pandas_fix': """# If Growth is more granular, aggregate to match Fabric
-growth_df_aggregated = growth_df.groupby(['campaign_name', 'day']).agg({
-    'cost': 'sum',
-    'impressions': 'sum',
-    'clicks': 'sum'
-}).reset_index()""",
-            
-            'sql_equivalent': """-- Ensure both sources use the same GROUP BY
-SELECT 
-    campaign_name, 
-    DATE(timestamp) as day,
-    SUM(cost) as cost,
-    SUM(impressions) as impressions,
-    SUM(clicks) as clicks
-FROM source
-GROUP BY campaign_name, DATE(timestamp)""",
-            
-            'prevention': "Standardize aggregation level in both pipelines. Document expected grain (e.g., campaign + date) in schema definitions."
-        }
+        return _GRAIN_MISMATCH_FIX.copy()
     
     @staticmethod
     def _fix_date_shift(cause: Dict) -> Dict:
-        return {
-            'pandas_fix': """# Normalize dates to UTC and same format
-growth_df['day'] = pd.to_datetime(growth_df['day']).dt.tz_localize(None).dt.date
-fabric_df['day'] = pd.to_datetime(fabric_df['day']).dt.tz_localize(None).dt.date""",
-            
-            'sql_equivalent': """-- Standardize timezone in queries
-DATE(timestamp AT TIME ZONE 'UTC') as day""",
-            
-            'prevention': "Always extract dates in UTC. Define timezone handling in data contract. Add validation checks in ETL for date consistency."
-        }
+        return _DATE_SHIFT_FIX.copy()
     
     @staticmethod
     def _fix_missing_campaigns(cause: Dict) -> Dict:
@@ -106,23 +134,13 @@ DATE(timestamp AT TIME ZONE 'UTC') as day""",
         fabric_only = cause['evidence'].get('fabric_only', [])
         
         return {
-            'pandas_fix': f"""# Filter to common campaigns only
-common_campaigns = set(growth_df['campaign_name']) & set(fabric_df['campaign_name'])
-growth_df_filtered = growth_df[growth_df['campaign_name'].isin(common_campaigns)]
-fabric_df_filtered = fabric_df[fabric_df['campaign_name'].isin(common_campaigns)]
-
-# Missing campaigns to investigate:
+            'pandas_fix': f"""{_MISSING_CAMPAIGNS_PANDAS}
 # Growth only: {growth_only[:3]}
 # Fabric only: {fabric_only[:3]}""",
             
-            'sql_equivalent': """-- Add campaign filter to align sources
-WHERE campaign_name IN (
-    SELECT campaign_name FROM growth_source
-    INTERSECT
-    SELECT campaign_name FROM fabric_source
-)""",
+            'sql_equivalent': _MISSING_CAMPAIGNS_SQL,
             
-            'prevention': "Implement campaign naming standards. Add validation to reject campaigns not in master list. Sync campaign metadata between systems."
+            'prevention': _MISSING_CAMPAIGNS_PREVENTION
         }
     
     @staticmethod
@@ -130,19 +148,18 @@ WHERE campaign_name IN (
         direction = cause['evidence']['direction']
         
         return {
-            'pandas_fix': """# Investigate filter or calculation differences
-# Check for:
-# 1. Different WHERE clauses
-# 2. Currency conversion issues
-# 3. Tax inclusion/exclusion
-# 4. Time window boundaries
-
-# Example debug:
-print("Growth date range:", growth_df['day'].min(), "to", growth_df['day'].max())
-print("Fabric date range:", fabric_df['day'].min(), "to", fabric_df['day'].max())""",
+            'pandas_fix': _SYSTEMATIC_BIAS_PANDAS,
             
-            'sql_equivalent': """-- Audit both queries for systematic differences
--- Compare: date filters, WHERE clauses, CASE statements, currency multipliers""",
+            'sql_equivalent': _SYSTEMATIC_BIAS_SQL,
             
-            'prevention': f"{'Growth' if 'growth' in direction else 'Fabric'} is consistently higher. Review source query logic, filters, and transformations. Ensure both use same business rules."
+            'prevention': f"{'Growth' if 'growth' in direction else 'Fabric'} {_SYSTEMATIC_BIAS_PREVENTION}"
         }
+
+# Root cause type -> fix builder (built after the class so the staticmethods exist)
+FixSuggestionEngine._DISPATCH = {
+    'duplicate_records': FixSuggestionEngine._fix_duplicates,
+    'grain_mismatch': FixSuggestionEngine._fix_grain_mismatch,
+    'date_shift': FixSuggestionEngine._fix_date_shift,
+    'missing_campaigns': FixSuggestionEngine._fix_missing_campaigns,
+    'systematic_bias': FixSuggestionEngine._fix_systematic_bias,
+}
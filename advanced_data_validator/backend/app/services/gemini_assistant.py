@@ -1,7 +1,37 @@
 import google.generativeai as genai
+import functools
 import os
+import re
+import threading
 from typing import Dict, List
-import json
+
+from .serialization import dumps_json
+
+# Answer markers in batched responses: "[Q1] ...", "[Q2] ..."
+ANSWER_MARKER = re.compile(r'^\s*\[Q(\d+)\]:?\s*', re.MULTILINE)
+
+
+# genai.configure() is process-global, so the SDK is configured with a single key
+_configured_api_key = None
+_configure_lock = threading.Lock()
+
+
+def _configure_sdk(api_key: str):
+    """Configure the SDK on first use; refuse a second, different key instead of switching silently."""
+    global _configured_api_key
+    with _configure_lock:
+        if _configured_api_key is None:
+            genai.configure(api_key=api_key)
+            _configured_api_key = api_key
+        elif api_key != _configured_api_key:
+            raise ValueError("Gemini SDK is already configured with a different API key")
+
+
+@functools.lru_cache(maxsize=4)
+def _get_model(model_name: str):
+    """Build each model once; they all share the key passed to _configure_sdk."""
+    return genai.GenerativeModel(model_name)
+
 
 class GeminiAssistant:
     """
@@ -13,18 +43,30 @@ class GeminiAssistant:
         if not self.api_key:
             raise ValueError("GOOGLE_API_KEY not found in environment")
         
-        genai.configure(api_key=self.api_key)
-        self.model = genai.GenerativeModel(model)
+        _configure_sdk(self.api_key)
+        self.model = _get_model(model)
         
-    def generate_summary(self, validation_results: Dict, root_causes: List[Dict], fixes: List[Dict]) -> str:
+    def generate_summary(self, validation_results: Dict, root_causes: List[Dict], fixes: List[Dict], stream: bool = False) -> str:
         """
         Generate a comprehensive summary of the validation analysis.
+        With stream=True the text is accumulated from streamed chunks.
         """
+        if stream:
+            return "".join(self.generate_summary_stream(validation_results, root_causes, fixes))
+        
         prompt = self._build_summary_prompt(validation_results, root_causes, fixes)
         
         response = self.model.generate_content(prompt)
         return response.text
     
+    def generate_summary_stream(self, validation_results: Dict, root_causes: List[Dict], fixes: List[Dict]):
+        """
+        Stream the summary as it's generated (for StreamingResponse).
+        Yields chunks of text.
+        """
+        prompt = self._build_summary_prompt(validation_results, root_causes, fixes)
+        yield from self.stream_response(prompt)
+    
     def answer_question(self, question: str, context: Dict) -> str:
         """
         Answer user questions about validation results interactively.
@@ -32,7 +74,7 @@ class GeminiAssistant:
         prompt = f"""You are Nyx, an expert data validation assistant. 
         
 Context (validation data):
-{json.dumps(context, indent=2)}
+{dumps_json(context, indent=True).decode()}
 
 User Question: {question}
 
@@ -41,6 +83,45 @@ Provide a clear, concise answer based on the validation data above. If the quest
         response = self.model.generate_content(prompt)
         return response.text
     
+    def batch_answer(self, questions: List[str], context: Dict) -> List[str]:
+        """
+        Answer several questions in one Gemini call, so the (large) context
+        is sent and billed once instead of once per question.
+        Returns one answer per question, in order.
+        """
+        if not questions:
+            return []
+        
+        numbered = "\n".join(f"[Q{i+1}] {q}" for i, q in enumerate(questions))
+        prompt = f"""You are Nyx, an expert data validation assistant. 
+        
+Context (validation data):
+{dumps_json(context, indent=True).decode()}
+
+User Questions:
+{numbered}
+
+Answer each question separately based on the validation data above. Start each answer on its own line, prefixed with its marker (e.g. [Q1]). If a question asks about specific metrics or campaigns, reference the exact numbers from the context."""
+
+        response = self.model.generate_content(prompt)
+        return self._split_answers(response.text, len(questions))
+    
+    @staticmethod
+    def _split_answers(text: str, count: int) -> List[str]:
+        """Split a batched response on its [Qi] markers."""
+        answers = [""] * count
+        parts = ANSWER_MARKER.split(text)
+        # parts = [preamble, n1, answer1, n2, answer2, ...]
+        for n, answer in zip(parts[1::2], parts[2::2]):
+            i = int(n) - 1
+            if 0 <= i < count:
+                answers[i] = answer.strip()
+        
+        # No markers at all - hand the whole text back as the first answer
+        if not any(answers):
+            answers[0] = text.strip()
+        return answers
+    
     def _build_summary_prompt(self, validation_results: Dict, root_causes: List[Dict], fixes: List[Dict]) -> str:
         """Build the prompt for summary generation."""
         
@@ -49,6 +130,14 @@ Provide a clear, concise answer based on the validation data above. If the quest
         total_segments = validation_results.get('summary', {}).get('total_segments', 0)
         passing_segments = validation_results.get('summary', {}).get('passing_segments', 0)
         
+        # Only the fields Gemini needs - keeps the prompt (and token bill) small
+        causes_text = "\n".join(
+            f"- [{c['type']}] {c['description']} (confidence: {c['confidence']})"
+            for c in root_causes
+        )
+        # Fixes are already code strings; join them instead of JSON-escaping them
+        fixes_text = "\n\n".join(f"### Fix {i+1}\n{f['pandas_fix']}" for i, f in enumerate(fixes))
+        
         prompt = f"""You are Nyx, an AI-powered data validation assistant. Analyze this validation report and provide a professional, actionable summary.
 
 VALIDATION RESULTS:
@@ -56,10 +145,10 @@ VALIDATION RESULTS:
 - Segments Passing: {passing_segments}/{total_segments}
 
 ROOT CAUSES IDENTIFIED:
-{json.dumps(root_causes, indent=2)}
+{causes_text}
 
 SUGGESTED FIXES:
-{json.dumps([f['pandas_fix'] for f in fixes], indent=2)}
+{fixes_text}
 
 Generate a summary that:
 1. Starts with an EXECUTIVE SUMMARY (2-3 sentences on data health)
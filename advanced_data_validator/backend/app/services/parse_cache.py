@@ -0,0 +1,84 @@
+"""
+On-disk cache of parsed upload files.
+Re-validating the same Growth/Gold file (dashboard refresh, re-run with new mappings)
+skips decoding/header detection and reads a parquet sidecar instead.
+Entries are keyed by file content, so re-uploads of the same file hit too.
+Off by default (the sidecars are copies of customer data kept outside temp_uploads);
+set PARSE_CACHE_DIR to a directory to enable.
+"""
+import hashlib
+import os
+import uuid
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+PARSE_CACHE_DIR = os.path.expanduser(os.getenv("PARSE_CACHE_DIR", ""))
+PARSE_CACHE_MAX_FILES = int(os.getenv("PARSE_CACHE_MAX_FILES", 64))
+# Bump when the reader's output changes so stale entries stop matching
+PARSE_CACHE_VERSION = 1
+
+_HASH_CHUNK_SIZE = 1024 * 1024  # 1 MB
+
+
+def cache_key(file_path: str) -> Optional[str]:
+    """Content hash of the file (plus reader version); None when caching is disabled."""
+    if not PARSE_CACHE_DIR:
+        return None
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"v{PARSE_CACHE_VERSION}|{Path(file_path).suffix.lower()}|".encode())
+    with open(file_path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_cached(key: Optional[str]) -> Optional[pd.DataFrame]:
+    """Return the cached frame for `key`, or None on a miss/unreadable entry."""
+    if key is None:
+        return None
+    path = Path(PARSE_CACHE_DIR) / f"{key}.parquet"
+    try:
+        df = pq.read_table(path).to_pandas()
+    except (OSError, pa.ArrowException):
+        return None
+    # Parquet brings NaN in text columns back as None; restore NaN so blanks key as 'nan' like a cold parse
+    for col in df.columns[df.dtypes == object]:
+        df[col] = df[col].where(df[col].notna(), np.nan)
+    return df
+
+
+def store_cached(key: Optional[str], df: pd.DataFrame):
+    """
+    Write `df` as a parquet sidecar. Frames parquet can't hold as-is
+    (non-string/duplicate headers, mixed-type columns) are simply not cached.
+    """
+    if key is None or not all(isinstance(c, str) for c in df.columns) or not df.columns.is_unique:
+        return
+
+    cache_dir = Path(PARSE_CACHE_DIR)
+    path = cache_dir / f"{key}.parquet"
+    tmp_path = cache_dir / f"{key}.{uuid.uuid4().hex}.tmp"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        pq.write_table(pa.Table.from_pandas(df), tmp_path, compression="zstd")
+        os.replace(tmp_path, path)  # atomic, so concurrent workers never read a partial file
+    except (OSError, pa.ArrowException, ValueError, TypeError):
+        tmp_path.unlink(missing_ok=True)
+        return
+
+    _prune(cache_dir)
+
+
+def _prune(cache_dir: Path):
+    """Keep at most PARSE_CACHE_MAX_FILES entries, dropping the least recently written."""
+    try:
+        entries = sorted(cache_dir.glob("*.parquet"), key=lambda p: p.stat().st_mtime)
+        for stale in entries[:max(len(entries) - PARSE_CACHE_MAX_FILES, 0)]:
+            stale.unlink(missing_ok=True)
+    except OSError:
+        pass
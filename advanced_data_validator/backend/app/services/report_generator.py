@@ -1,133 +1,50 @@
 from datetime import datetime
+from string import Template
 from typing import Dict
-import json
 
-class ReportGenerator:
-    """
-    Generates comprehensive HTML reports with interactive charts and detailed tables.
-    """
-    
-    @staticmethod
-    def _generate_detailed_tables(results: Dict) -> str:
-        """Generates detailed HTML tables for each validation segment."""
-        sections = []
-        
-        segment_titles = {
-            "by_date": "Timeline Validation Matrix",
-            "by_campaign": "Campaign Performance Integrity",
-            "by_platform": "Platform Distribution Integrity",
-            "by_placement": "Placement-Level Granularity Check",
-            "by_gender": "Demographic: Gender Matching",
-            "by_age": "Demographic: Age Group Analysis",
-            "by_camp_date": "Deep Dive: Campaign + Date Reconciliation"
-        }
-        
-        for key, rows in results.items():
-            if key == "overall" or not rows:
-                continue
-            
-            title = segment_titles.get(key, key.replace("_", " ").title())
-            
-            # Determine join key column
-            sample = rows[0]
-            join_key = [k for k in sample.keys() if '_csv' not in k and '_fab' not in k and k != 'perfect_match'][0]
-            
-            # Check if reach, purchases, and conversion_value exist in data
-            has_reach = 'reach_csv' in sample or 'reach_fab' in sample
-            has_purchases = 'purchases_csv' in sample or 'purchases_fab' in sample
-            has_conv_value = 'conversion_value_csv' in sample or 'conversion_value_fab' in sample
-            
-            # Build header
-            reach_header = '<th>Reach (CSV/Gold)</th>' if has_reach else ''
-            purchases_header = '<th>Purchases (CSV/Gold)</th>' if has_purchases else ''
-            conv_value_header = '<th>Conv Value (CSV/Gold)</th>' if has_conv_value else ''
-            colspan = 5 + (1 if has_reach else 0) + (1 if has_purchases else 0) + (1 if has_conv_value else 0)
-            
-            table_html = f'''
-            <div class="section">
-                <h2>{title}</h2>
-                <div style="overflow-x: auto;">
-                    <table>
-                        <tr>
-                            <th>{join_key.replace("_", " ").title()}</th>
-                            <th>Cost (CSV/Gold)</th>
-                            <th>Impr (CSV/Gold)</th>
-                            <th>Clicks (CSV/Gold)</th>
-                            {reach_header}
-                            {purchases_header}
-                            {conv_value_header}
-                            <th>Status</th>
-                        </tr>
-            '''
-            
-            # Limit to top 50 rows for report size
-            for row in rows[:50]:
-                status = "PASS" if row.get('perfect_match') else "FAIL"
-                status_class = "pass" if status == "PASS" else "fail"
-                
-                # Build reach, purchases, and conversion_value cells
-                reach_cell = f"<td>{row.get('reach_csv', 0):,.0f} / {row.get('reach_fab', 0):,.0f}</td>" if has_reach else ''
-                purchases_cell = f"<td>{row.get('purchases_csv', 0):,.0f} / {row.get('purchases_fab', 0):,.0f}</td>" if has_purchases else ''
-                conv_value_cell = f"<td>{row.get('conversion_value_csv', 0):,.2f} / {row.get('conversion_value_fab', 0):,.2f}</td>" if has_conv_value else ''
-                
-                table_html += f'''
-                        <tr>
-                            <td>{row.get(join_key)}</td>
-                            <td>{row.get('cost_csv', 0):,.2f} / {row.get('cost_fab', 0):,.2f}</td>
-                            <td>{row.get('impressions_csv', 0):,.0f} / {row.get('impressions_fab', 0):,.0f}</td>
-                            <td>{row.get('clicks_csv', 0):,.0f} / {row.get('clicks_fab', 0):,.0f}</td>
-                            {reach_cell}
-                            {purchases_cell}
-                            {conv_value_cell}
-                            <td class="{status_class}">{status}</td>
-                        </tr>
-                '''
-            
-            if len(rows) > 50:
-                table_html += f'<tr><td colspan="{colspan}" style="text-align: center; font-style: italic; color: #94a3b8;">... and {len(rows)-50} more rows</td></tr>'
-                
-            table_html += '''
+from .serialization import dumps_json
+
+# Segment key -> section heading in the detailed tables
+SEGMENT_TITLES = {
+    "by_date": "Timeline Validation Matrix",
+    "by_campaign": "Campaign Performance Integrity",
+    "by_platform": "Platform Distribution Integrity",
+    "by_placement": "Placement-Level Granularity Check",
+    "by_gender": "Demographic: Gender Matching",
+    "by_age": "Demographic: Age Group Analysis",
+    "by_camp_date": "Deep Dive: Campaign + Date Reconciliation"
+}
+
+# Segment chart bar colours by match rate (>95%, >80%, rest)
+SEGMENT_COLOR_GOOD = 'rgba(16, 185, 129, 0.7)'
+SEGMENT_COLOR_WARN = 'rgba(251, 191, 36, 0.7)'
+SEGMENT_COLOR_BAD = 'rgba(239, 68, 68, 0.7)'
+# Same colours at full opacity for the bar borders
+SEGMENT_BORDER_COLORS = {
+    color: color.replace('0.7', '1')
+    for color in (SEGMENT_COLOR_GOOD, SEGMENT_COLOR_WARN, SEGMENT_COLOR_BAD)
+}
+
+# Defaults for rows that lack some metric columns
+ZERO_METRICS = {
+    f"{metric}{side}": 0
+    for metric in ('cost', 'impressions', 'clicks', 'reach', 'purchases', 'conversion_value')
+    for side in ('_csv', '_fab')
+}
+
+# Status cells only come in two flavours
+PASS_CELL = '<td class="pass">PASS</td>'
+FAIL_CELL = '<td class="fail">FAIL</td>'
+
+TABLE_FOOTER_HTML = '''
                     </table>
                 </div>
             </div>
             '''
-            sections.append(table_html)
-            
-        return "\n".join(sections)
 
-    @staticmethod
-    def generate_html_report(validation_results: Dict, summary: Dict, threshold: float = 3.0) -> str:
-        """
-        Generate a complete HTML report with all validation data.
-        
-        Args:
-            validation_results: Full validation results dict
-            summary: Summary statistics dict
-            threshold: Validation threshold percentage
-            
-        Returns:
-            HTML string ready to be saved as a file
-        """
-        
-        # Prepare chart data
-        overall_match_rate = summary.get('overall_match_rate', 0)
-        total_segments = summary.get('total_segments', 0)
-        passing_segments = summary.get('passing_segments', 0)
-        
-        # Summary table data
-        details = summary.get('details', [])
-        segment_labels = [d['type'].replace('_', ' ').title() for d in details]
-        segment_percentages = [d['percent'] for d in details]
-        
-        # Color coding based on match rates
-        segment_colors = [
-            'rgba(16, 185, 129, 0.7)' if p > 95 else 
-            'rgba(251, 191, 36, 0.7)' if p > 80 else 
-            'rgba(239, 68, 68, 0.7)' 
-            for p in segment_percentages
-        ]
-        
-        html_content = f'''<!DOCTYPE html>
+# Report page pieces. The <head> is fully static; the body parts use string.Template
+# ($name) so the CSS/JS braces don't need escaping and nothing is re-parsed per call.
+REPORT_HEAD_HTML = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -136,13 +53,13 @@ class ReportGenerator:
     <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"></script>
     <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;600;700;900&display=swap" rel="stylesheet">
     <style>
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
 
-        body {{
+        body {
             font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
             background: radial-gradient(circle at 20% 50%, rgba(102, 126, 234, 0.15) 0%, transparent 50%),
                         radial-gradient(circle at 80% 80%, rgba(245, 87, 108, 0.1) 0%, transparent 50%),
@@ -150,9 +67,9 @@ class ReportGenerator:
             padding: 40px 20px;
             min-height: 100vh;
             color: #f8fafc;
-        }}
+        }
 
-        .container {{
+        .container {
             max-width: 1400px;
             margin: 0 auto;
             background: linear-gradient(135deg, rgba(255, 255, 255, 0.05) 0%, rgba(255, 255, 255, 0.02) 100%);
@@ -161,17 +78,17 @@ class ReportGenerator:
             border: 1px solid rgba(255, 255, 255, 0.1);
             box-shadow: 0 25px 50px -12px rgba(0, 0, 0, 0.5);
             overflow: hidden;
-        }}
+        }
 
-        .header {{
+        .header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             padding: 60px 40px;
             text-align: center;
             position: relative;
             overflow: hidden;
-        }}
+        }
 
-        .header::before {{
+        .header::before {
             content: '';
             position: absolute;
             top: 0;
@@ -179,31 +96,31 @@ class ReportGenerator:
             right: 0;
             height: 1px;
             background: linear-gradient(90deg, transparent, rgba(255, 255, 255, 0.4), transparent);
-        }}
+        }
 
-        .header h1 {{
+        .header h1 {
             font-size: 3rem;
             font-weight: 900;
             margin-bottom: 15px;
             text-shadow: 2px 2px 8px rgba(0, 0, 0, 0.3);
             letter-spacing: -0.05em;
-        }}
+        }
 
-        .header p {{
+        .header p {
             font-size: 1.2rem;
             opacity: 0.95;
             font-weight: 600;
-        }}
+        }
 
-        .metrics-grid {{
+        .metrics-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
             gap: 24px;
             padding: 40px;
             background: rgba(15, 23, 42, 0.3);
-        }}
+        }
 
-        .metric-card {{
+        .metric-card {
             background: linear-gradient(135deg, rgba(255, 255, 255, 0.05) 0%, rgba(255, 255, 255, 0.02) 100%);
             backdrop-filter: blur(20px);
             padding: 30px;
@@ -211,24 +128,24 @@ class ReportGenerator:
             border: 1px solid rgba(255, 255, 255, 0.1);
             box-shadow: 0 10px 25px -5px rgba(0, 0, 0, 0.3);
             transition: all 0.3s ease;
-        }}
+        }
 
-        .metric-card:hover {{
+        .metric-card:hover {
             transform: translateY(-5px);
             border-color: rgba(255, 255, 255, 0.2);
             box-shadow: 0 20px 40px -10px rgba(0, 0, 0, 0.4);
-        }}
+        }
 
-        .metric-card h3 {{
+        .metric-card h3 {
             font-size: 0.75rem;
             font-weight: 900;
             text-transform: uppercase;
             letter-spacing: 1.5px;
             color: #94a3b8;
             margin-bottom: 15px;
-        }}
+        }
 
-        .metric-card .value {{
+        .metric-card .value {
             font-size: 3rem;
             font-weight: 900;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
@@ -236,46 +153,46 @@ class ReportGenerator:
             -webkit-text-fill-color: transparent;
             background-clip: text;
             margin-bottom: 8px;
-        }}
+        }
 
-        .metric-card .desc {{
+        .metric-card .desc {
             font-size: 0.875rem;
             color: #94a3b8;
-        }}
+        }
 
-        .dashboard-grid {{
+        .dashboard-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(550px, 1fr));
             gap: 30px;
             padding: 40px;
-        }}
+        }
 
-        .chart-container {{
+        .chart-container {
             background: linear-gradient(135deg, rgba(255, 255, 255, 0.05) 0%, rgba(255, 255, 255, 0.02) 100%);
             backdrop-filter: blur(20px);
             padding: 30px;
             border-radius: 20px;
             border: 1px solid rgba(255, 255, 255, 0.1);
             box-shadow: 0 10px 25px -5px rgba(0, 0, 0, 0.3);
-        }}
+        }
 
-        .chart-container h3 {{
+        .chart-container h3 {
             font-size: 1.25rem;
             font-weight: 900;
             margin-bottom: 25px;
             color: #f8fafc;
-        }}
+        }
 
-        .chart-wrapper {{
+        .chart-wrapper {
             position: relative;
             height: 350px;
-        }}
+        }
 
-.content {{
+.content {
             padding: 40px;
-        }}
+        }
 
-        table {{
+        table {
             width: 100%;
             border-collapse: collapse;
             margin-top: 20px;
@@ -284,9 +201,9 @@ class ReportGenerator:
             border-radius: 20px;
             overflow: hidden;
             border: 1px solid rgba(255, 255, 255, 0.1);
-        }}
+        }
 
-        th {{
+        th {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 18px;
@@ -295,41 +212,41 @@ class ReportGenerator:
             text-transform: uppercase;
             font-size: 0.75rem;
             letter-spacing: 1px;
-        }}
+        }
 
-        td {{
+        td {
             padding: 16px 18px;
             border-bottom: 1px solid rgba(255, 255, 255, 0.05);
             color: #f8fafc;
-        }}
+        }
 
-        tr:hover {{
+        tr:hover {
             background-color: rgba(255, 255, 255, 0.05);
-        }}
+        }
 
-        .pass {{
+        .pass {
             color: #10b981;
             font-weight: 700;
-        }}
+        }
 
-        .fail {{
+        .fail {
             color: #ef4444;
             font-weight: 700;
-        }}
+        }
 
-        .footer {{
+        .footer {
             background: rgba(15, 23, 42, 0.6);
             color: #94a3b8;
             text-align: center;
             padding: 30px;
             font-size: 0.875rem;
-        }}
+        }
 
-        .section {{
+        .section {
             margin-bottom: 50px;
-        }}
+        }
 
-        .section h2 {{
+        .section h2 {
             font-size: 2rem;
             font-weight: 900;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
@@ -337,31 +254,33 @@ class ReportGenerator:
             -webkit-text-fill-color: transparent;
             background-clip: text;
             margin-bottom: 25px;
-        }}
+        }
     </style>
 </head>
-<body>
+'''
+
+REPORT_BODY_TOP = Template('''<body>
     <div class="container">
         <div class="header">
             <h1>🔮 NYX DATA VALIDATION REPORT</h1>
-            <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-            <p>Threshold: ±{threshold}%</p>
+            <p>Generated: $generated_at</p>
+            <p>Threshold: ±$threshold%</p>
         </div>
 
         <div class="metrics-grid">
             <div class="metric-card">
                 <h3>Overall Match Rate</h3>
-                <div class="value">{overall_match_rate:.1f}%</div>
+                <div class="value">$overall_match_rate%</div>
                 <div class="desc">Validation health score</div>
             </div>
             <div class="metric-card">
                 <h3>Segments Passing</h3>
-                <div class="value">{passing_segments}/{total_segments}</div>
+                <div class="value">$passing_segments/$total_segments</div>
                 <div class="desc">Within threshold</div>
             </div>
             <div class="metric-card">
                 <h3>Threshold</h3>
-                <div class="value">±{threshold}%</div>
+                <div class="value">±$threshold%</div>
                 <div class="desc">Acceptance margin</div>
             </div>
         </div>
@@ -392,14 +311,9 @@ class ReportGenerator:
                         <th>Matches</th>
                         <th>Match %</th>
                     </tr>
-                    {"".join([f'''
-                    <tr>
-                        <td>{d["type"].replace("_", " ").title()}</td>
-                        <td>{d["total"]}</td>
-                        <td>{d["matches"]}</td>
-                        <td class="{'pass' if d['percent'] > 95 else 'fail'}">{d["percent"]:.2f}%</td>
-                    </tr>
-                    ''' for d in details])}
+                    ''')
+
+REPORT_OVERALL_TABLE_TOP = '''
                 </table>
             </div>
 
@@ -414,25 +328,20 @@ class ReportGenerator:
                         <th>Diff %</th>
                         <th>Status</th>
                     </tr>
-                    {"".join([f'''
-                    <tr>
-                        <td style="font-weight: 700; text-transform: capitalize;">{m["metric"]}</td>
-                        <td>{m["csv"]:,.2f}</td>
-                        <td>{m["fabric"]:,.2f}</td>
-                        <td>{m["diff"]:,.2f}</td>
-                        <td>{m["diff_pct"]:.2f}%</td>
-                        <td class="{'pass' if m['match'] else 'fail'}">{'PASS' if m['match'] else 'FAIL'}</td>
-                    </tr>
-                    ''' for m in validation_results.get("overall", [])])}
+                    '''
+
+REPORT_TABLE_END = '''
                 </table>
             </div>
 
-            {ReportGenerator._generate_detailed_tables(validation_results)}
+            '''
+
+REPORT_BODY_BOTTOM = Template('''
         </div>
 
         <div class="footer">
             <p><strong>NYX Data Validator</strong> | AI-Powered Validation Platform</p>
-            <p>Overall Match Rate: {overall_match_rate:.1f}% | Threshold: ±{threshold}%</p>
+            <p>Overall Match Rate: $overall_match_rate% | Threshold: ±$threshold%</p>
         </div>
     </div>
 
@@ -441,63 +350,63 @@ class ReportGenerator:
         Chart.defaults.color = '#94a3b8';
 
         const segmentCtx = document.getElementById('segmentChart').getContext('2d');
-        new Chart(segmentCtx, {{
+        new Chart(segmentCtx, {
             type: 'bar',
-            data: {{
-                labels: {json.dumps(segment_labels)},
-                datasets: [{{
+            data: {
+                labels: $labels_json,
+                datasets: [{
                     label: 'Match Rate (%)',
-                    data: {json.dumps(segment_percentages)},
-                    backgroundColor: {json.dumps(segment_colors)},
-                    borderColor: {json.dumps([c.replace('0.7', '1') for c in segment_colors])},
+                    data: $percentages_json,
+                    backgroundColor: $colors_json,
+                    borderColor: $border_colors_json,
                     borderWidth: 3,
                     borderRadius: 12
-                }}]
-            }},
-            options: {{
+                }]
+            },
+            options: {
                 responsive: true,
                 maintainAspectRatio: false,
-                plugins: {{
-                    legend: {{ display: false }},
-                    tooltip: {{
+                plugins: {
+                    legend: { display: false },
+                    tooltip: {
                         backgroundColor: 'rgba(10, 14, 39, 0.95)',
                         padding: 16,
-                        titleFont: {{ size: 14, weight: 'bold' }},
-                        bodyFont: {{ size: 13 }},
+                        titleFont: { size: 14, weight: 'bold' },
+                        bodyFont: { size: 13 },
                         borderColor: 'rgba(102, 126, 234, 0.5)',
                         borderWidth: 2,
                         cornerRadius: 12
-                    }}
-                }},
-                scales: {{
-                    y: {{
+                    }
+                },
+                scales: {
+                    y: {
                         beginAtZero: true,
                         max: 100,
-                        grid: {{ color: 'rgba(255,255,255,0.05)' }},
-                        ticks: {{ 
+                        grid: { color: 'rgba(255,255,255,0.05)' },
+                        ticks: { 
                             color: '#94a3b8',
-                            font: {{ weight: 600 }}
-                        }}
-                    }},
-                    x: {{
-                        grid: {{ display: false }},
-                        ticks: {{ 
+                            font: { weight: 600 }
+                        }
+                    },
+                    x: {
+                        grid: { display: false },
+                        ticks: { 
                             color: '#94a3b8',
-                            font: {{ weight: 600 }}
-                        }}
-                    }}
-                }}
-            }}
-        }});
+                            font: { weight: 600 }
+                        }
+                    }
+                }
+            }
+        });
 
         const radarCtx = document.getElementById('radarChart').getContext('2d');
-        new Chart(radarCtx, {{
+        new Chart(radarCtx, {
             type: 'radar',
-            data: {{
-                labels: {json.dumps(segment_labels)},
-                datasets: [{{
+            data: {
+                labels: $labels_json,
+                datasets: [{
                     label: 'Validation Score',
-                    data: {json.dumps(segment_percentages)},
+                    data: $percentages_json,
                     backgroundColor: 'rgba(102, 126, 234, 0.2)',
                     borderColor: '#667eea',
                     borderWidth: 4,
@@ -505,42 +414,222 @@ class ReportGenerator:
                     pointBorderColor: '#fff',
                     pointBorderWidth: 3,
                     pointRadius: 6
-                }}]
-            }},
-            options: {{
+                }]
+            },
+            options: {
                 responsive: true,
                 maintainAspectRatio: false,
-                plugins: {{
-                    legend: {{ display: false }},
-                    tooltip: {{
+                plugins: {
+                    legend: { display: false },
+                    tooltip: {
                         backgroundColor: 'rgba(10, 14, 39, 0.95)',
                         padding: 16,
                         borderColor: 'rgba(102, 126, 234, 0.5)',
                         borderWidth: 2,
                         cornerRadius: 12
-                    }}
-                }},
-                scales: {{
-                    r: {{
+                    }
+                },
+                scales: {
+                    r: {
                         min: 0,
                         max: 100,
-                        grid: {{ color: 'rgba(255,255,255,0.08)' }},
-                        angleLines: {{ color: 'rgba(255,255,255,0.08)' }},
-                        ticks: {{
+                        grid: { color: 'rgba(255,255,255,0.08)' },
+                        angleLines: { color: 'rgba(255,255,255,0.08)' },
+                        ticks: {
                             color: '#94a3b8',
                             backdropColor: 'transparent',
-                            font: {{ weight: 600 }}
-                        }},
-                        pointLabels: {{
+                            font: { weight: 600 }
+                        },
+                        pointLabels: {
                             color: '#f8fafc',
-                            font: {{ weight: 700, size: 12 }}
-                        }}
-                    }}
-                }}
-            }}
-        }});
+                            font: { weight: 700, size: 12 }
+                        }
+                    }
+                }
+            }
+        });
     </script>
 </body>
-</html>'''
+</html>''')
+
+class ReportGenerator:
+    """
+    Generates comprehensive HTML reports with interactive charts and detailed tables.
+    """
+    
+    @staticmethod
+    def _generate_detailed_tables(results: Dict) -> str:
+        """Generates detailed HTML tables for each validation segment."""
+        sections = []
         
-        return html_content
+        for key, rows in results.items():
+            if key == "overall" or not rows:
+                continue
+            
+            title = SEGMENT_TITLES.get(key, key.replace("_", " ").title())
+            
+            # Determine join key column
+            sample = rows[0]
+            join_key = [k for k in sample.keys() if '_csv' not in k and '_fab' not in k and k != 'perfect_match'][0]
+            
+            # Check if reach, purchases, and conversion_value exist in data
+            has_reach = 'reach_csv' in sample or 'reach_fab' in sample
+            has_purchases = 'purchases_csv' in sample or 'purchases_fab' in sample
+            has_conv_value = 'conversion_value_csv' in sample or 'conversion_value_fab' in sample
+            
+            # Build header
+            reach_header = '<th>Reach (CSV/Gold)</th>' if has_reach else ''
+            purchases_header = '<th>Purchases (CSV/Gold)</th>' if has_purchases else ''
+            conv_value_header = '<th>Conv Value (CSV/Gold)</th>' if has_conv_value else ''
+            colspan = 5 + (1 if has_reach else 0) + (1 if has_purchases else 0) + (1 if has_conv_value else 0)
+            
+            header_html = f'''
+            <div class="section">
+                <h2>{title}</h2>
+                <div style="overflow-x: auto;">
+                    <table>
+                        <tr>
+                            <th>{join_key.replace("_", " ").title()}</th>
+                            <th>Cost (CSV/Gold)</th>
+                            <th>Impr (CSV/Gold)</th>
+                            <th>Clicks (CSV/Gold)</th>
+                            {reach_header}
+                            {purchases_header}
+                            {conv_value_header}
+                            <th>Status</th>
+                        </tr>
+            '''
+            
+            def render_row(row: Dict) -> str:
+                """
+                Render one table row; optional metric cells follow the segment's columns.
+                Metrics are indexed directly - rows missing one go through render() below.
+                """
+                passed = row.get('perfect_match')
+                reach_cell = f"<td>{row['reach_csv']:,.0f} / {row['reach_fab']:,.0f}</td>" if has_reach else ''
+                purchases_cell = f"<td>{row['purchases_csv']:,.0f} / {row['purchases_fab']:,.0f}</td>" if has_purchases else ''
+                conv_value_cell = f"<td>{row['conversion_value_csv']:,.2f} / {row['conversion_value_fab']:,.2f}</td>" if has_conv_value else ''
+                
+                return f'''
+                        <tr>
+                            <td>{row.get(join_key)}</td>
+                            <td>{row['cost_csv']:,.2f} / {row['cost_fab']:,.2f}</td>
+                            <td>{row['impressions_csv']:,.0f} / {row['impressions_fab']:,.0f}</td>
+                            <td>{row['clicks_csv']:,.0f} / {row['clicks_fab']:,.0f}</td>
+                            {reach_cell}
+                            {purchases_cell}
+                            {conv_value_cell}
+                            {PASS_CELL if passed else FAIL_CELL}
+                        </tr>
+                '''
+            
+            def render(row: Dict) -> str:
+                try:
+                    return render_row(row)
+                except KeyError:
+                    # Missing metrics render as 0
+                    return render_row({**ZERO_METRICS, **row})
+            
+            # Collect row strings and join once - repeated += copies the whole table per row
+            # Limit to top 50 rows for report size
+            parts = [render(row) for row in rows[:50]]
+            
+            if len(rows) > 50:
+                parts.append(f'<tr><td colspan="{colspan}" style="text-align: center; font-style: italic; color: #94a3b8;">... and {len(rows)-50} more rows</td></tr>')
+                
+            sections.append(header_html + ''.join(parts) + TABLE_FOOTER_HTML)
+            
+        return "\n".join(sections)
+
+    @staticmethod
+    def generate_html_report(validation_results: Dict, summary: Dict, threshold: float = 3.0) -> str:
+        """
+        Generate a complete HTML report with all validation data.
+        
+        Args:
+            validation_results: Full validation results dict
+            summary: Summary statistics dict
+            threshold: Validation threshold percentage
+            
+        Returns:
+            HTML string ready to be saved as a file
+        """
+        
+        # Prepare chart data
+        overall_match_rate = summary.get('overall_match_rate', 0)
+        total_segments = summary.get('total_segments', 0)
+        passing_segments = summary.get('passing_segments', 0)
+        
+        # Summary table data
+        details = summary.get('details', [])
+        segment_labels = [d['type'].replace('_', ' ').title() for d in details]
+        segment_percentages = [d['percent'] for d in details]
+        
+        # Color coding based on match rates
+        segment_colors = [
+            SEGMENT_COLOR_GOOD if p > 95 else 
+            SEGMENT_COLOR_WARN if p > 80 else 
+            SEGMENT_COLOR_BAD 
+            for p in segment_percentages
+        ]
+        
+        # Chart data - each series is encoded once and reused by both charts
+        labels_json = dumps_json(segment_labels).decode()
+        percentages_json = dumps_json(segment_percentages).decode()
+        colors_json = dumps_json(segment_colors).decode()
+        border_colors_json = dumps_json([SEGMENT_BORDER_COLORS[c] for c in segment_colors]).decode()
+        
+        summary_rows = "".join(ReportGenerator._summary_row(d) for d in details)
+        overall_rows = "".join(ReportGenerator._overall_row(m) for m in validation_results.get("overall", []))
+        
+        return ''.join([
+            REPORT_HEAD_HTML,
+            REPORT_BODY_TOP.substitute(
+                generated_at=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                threshold=threshold,
+                overall_match_rate=f"{overall_match_rate:.1f}",
+                passing_segments=passing_segments,
+                total_segments=total_segments
+            ),
+            summary_rows,
+            REPORT_OVERALL_TABLE_TOP,
+            overall_rows,
+            REPORT_TABLE_END,
+            ReportGenerator._generate_detailed_tables(validation_results),
+            REPORT_BODY_BOTTOM.substitute(
+                overall_match_rate=f"{overall_match_rate:.1f}",
+                threshold=threshold,
+                labels_json=labels_json,
+                percentages_json=percentages_json,
+                colors_json=colors_json,
+                border_colors_json=border_colors_json
+            )
+        ])
+    
+    @staticmethod
+    def _summary_row(d: Dict) -> str:
+        """One row of the Validation Summary table."""
+        status_class = 'pass' if d['percent'] > 95 else 'fail'
+        return f'''
+                    <tr>
+                        <td>{d["type"].replace("_", " ").title()}</td>
+                        <td>{d["total"]}</td>
+                        <td>{d["matches"]}</td>
+                        <td class="{status_class}">{d["percent"]:.2f}%</td>
+                    </tr>
+                    '''
+    
+    @staticmethod
+    def _overall_row(m: Dict) -> str:
+        """One row of the Overall Metrics Comparison table."""
+        status_class, status = ('pass', 'PASS') if m['match'] else ('fail', 'FAIL')
+        return f'''
+                    <tr>
+                        <td style="font-weight: 700; text-transform: capitalize;">{m["metric"]}</td>
+                        <td>{m["csv"]:,.2f}</td>
+                        <td>{m["fabric"]:,.2f}</td>
+                        <td>{m["diff"]:,.2f}</td>
+                        <td>{m["diff_pct"]:.2f}%</td>
+                        <td class="{status_class}">{status}</td>
+                    </tr>
+                    '''
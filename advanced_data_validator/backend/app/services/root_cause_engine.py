@@ -11,6 +11,9 @@ class RootCauseEngine:
         self.growth_df = growth_df
         self.fabric_df = fabric_df
         self.root_causes = []
+        # (growth_stats, fabric_stats), built on first analyze() and reused after
+        self._stats = None
+        self._identical = None
         
     def analyze(self, validation_results: Dict) -> List[Dict]:
         """
@@ -29,26 +32,69 @@ class RootCauseEngine:
         # Rule 1: Duplicate Detection
         self._detect_duplicates()
         
+        # Identical frames can't differ in grain, dates or campaigns - skip those rules
+        if self._identical is None:
+            self._identical = self._frames_identical()
+        if not self._identical:
+            self._detect_frame_differences()
+        
+        # Rule 5: Systematic Bias (one source consistently higher)
+        self._detect_systematic_bias(validation_results)
+        
+        return self.root_causes
+    
+    def _frames_identical(self) -> bool:
+        """Exact (vectorized) equality; the shape check makes the usual mismatch O(1)."""
+        return (
+            self.growth_df.shape == self.fabric_df.shape
+            and self.growth_df.columns.equals(self.fabric_df.columns)
+            and self.growth_df.equals(self.fabric_df)
+        )
+    
+    def _detect_frame_differences(self):
+        """Rules 2-4: compare row counts, dates and campaigns between the frames."""
+        # Read each shared column once; the detectors below only compare these stats
+        if self._stats is None:
+            shared_columns = set(self.growth_df.columns) & set(self.fabric_df.columns)
+            self._stats = (
+                self._collect_stats(self.growth_df, shared_columns),
+                self._collect_stats(self.fabric_df, shared_columns)
+            )
+        growth_stats, fabric_stats = self._stats
+        
         # Rule 2: Row Count Mismatch (Grain Issue)
-        self._detect_grain_mismatch()
+        self._detect_grain_mismatch(growth_stats, fabric_stats)
         
         # Rule 3: Date Shift Detection
-        self._detect_date_shift()
+        self._detect_date_shift(growth_stats, fabric_stats)
         
         # Rule 4: Missing Campaigns
-        self._detect_missing_campaigns()
+        self._detect_missing_campaigns(growth_stats, fabric_stats)
+    
+    @staticmethod
+    def _collect_stats(df: pd.DataFrame, shared_columns: set) -> Dict:
+        """
+        Row count plus unique days/campaigns for one frame.
+        Days/campaigns are None unless both frames have the column.
+        """
+        stats = {'n_rows': df.shape[0], 'days': None, 'campaigns': None}
         
-        # Rule 5: Systematic Bias (one source consistently higher)
-        self._detect_systematic_bias(validation_results)
+        # DatetimeIndex/Index set ops hash in C instead of through Python objects
+        if 'day' in shared_columns:
+            stats['days'] = pd.DatetimeIndex(pd.to_datetime(df['day'])).unique()
+        if 'campaign_name' in shared_columns:
+            stats['campaigns'] = pd.Index(df['campaign_name'].unique())
         
-        return self.root_causes
+        return stats
     
     def _detect_duplicates(self):
         """Check for duplicate rows in Growth data."""
         growth_dupes = self.growth_df.duplicated().sum()
-        fabric_dupes = self.fabric_df.duplicated().sum()
         
+        # Clean Growth data is the common case - skip hashing Fabric and the sample pass
         if growth_dupes > 0:
+            fabric_dupes = self.fabric_df.duplicated().sum()
+            
             self.root_causes.append({
                 'type': 'duplicate_records',
                 'evidence': {
@@ -60,10 +106,10 @@ class RootCauseEngine:
                 'description': f'Growth CSV contains {growth_dupes} duplicate rows, inflating totals.'
             })
     
-    def _detect_grain_mismatch(self):
+    def _detect_grain_mismatch(self, growth_stats: Dict, fabric_stats: Dict):
         """Detect if datasets are at different aggregation levels."""
-        growth_rows = len(self.growth_df)
-        fabric_rows = len(self.fabric_df)
+        growth_rows = growth_stats['n_rows']
+        fabric_rows = fabric_stats['n_rows']
         
         row_diff_pct = abs(growth_rows - fabric_rows) / max(growth_rows, fabric_rows) * 100
         
@@ -79,16 +125,15 @@ class RootCauseEngine:
                 'description': f'Row count differs by {row_diff_pct:.1f}%, suggesting different aggregation levels or filters.'
             })
     
-    def _detect_date_shift(self):
+    def _detect_date_shift(self, growth_stats: Dict, fabric_stats: Dict):
         """Detect if dates are misaligned (timezone issues)."""
-        if 'day' not in self.growth_df.columns or 'day' not in self.fabric_df.columns:
+        growth_dates = growth_stats['days']
+        fabric_dates = fabric_stats['days']
+        if growth_dates is None or fabric_dates is None:
             return
         
-        growth_dates = pd.to_datetime(self.growth_df['day']).unique()
-        fabric_dates = pd.to_datetime(self.fabric_df['day']).unique()
-        
-        growth_only = set(growth_dates) - set(fabric_dates)
-        fabric_only = set(fabric_dates) - set(growth_dates)
+        growth_only = growth_dates.difference(fabric_dates)
+        fabric_only = fabric_dates.difference(growth_dates)
         
         if len(growth_only) > 0 or len(fabric_only) > 0:
             self.root_causes.append({
@@ -96,30 +141,29 @@ class RootCauseEngine:
                 'evidence': {
                     'growth_only_dates': len(growth_only),
                     'fabric_only_dates': len(fabric_only),
-                    'sample_growth_only': [str(d) for d in list(growth_only)[:3]],
-                    'sample_fabric_only': [str(d) for d in list(fabric_only)[:3]]
+                    'sample_growth_only': [str(d) for d in growth_only[:3]],
+                    'sample_fabric_only': [str(d) for d in fabric_only[:3]]
                 },
                 'confidence': 0.75,
                 'description': 'Date ranges don\'t align perfectly - possible timezone shift or data lag.'
             })
     
-    def _detect_missing_campaigns(self):
+    def _detect_missing_campaigns(self, growth_stats: Dict, fabric_stats: Dict):
         """Identify campaigns present in one dataset but not the other."""
-        if 'campaign_name' not in self.growth_df.columns or 'campaign_name' not in self.fabric_df.columns:
+        growth_camps = growth_stats['campaigns']
+        fabric_camps = fabric_stats['campaigns']
+        if growth_camps is None or fabric_camps is None:
             return
         
-        growth_camps = set(self.growth_df['campaign_name'].unique())
-        fabric_camps = set(self.fabric_df['campaign_name'].unique())
-        
-        growth_only = growth_camps - fabric_camps
-        fabric_only = fabric_camps - growth_camps
+        growth_only = growth_camps.difference(fabric_camps)
+        fabric_only = fabric_camps.difference(growth_camps)
         
         if len(growth_only) > 0 or len(fabric_only) > 0:
             self.root_causes.append({
                 'type': 'missing_campaigns',
                 'evidence': {
-                    'growth_only': list(growth_only)[:5],
-                    'fabric_only': list(fabric_only)[:5]
+                    'growth_only': growth_only[:5].tolist(),
+                    'fabric_only': fabric_only[:5].tolist()
                 },
                 'confidence': 0.90,
                 'description': f'{len(growth_only)} campaigns exist only in Growth, {len(fabric_only)} only in Fabric.'
@@ -130,22 +174,32 @@ class RootCauseEngine:
         if 'overall' not in validation_results:
             return
         
-        biases = []
+        # Track the one direction seen so far; a disagreeing metric rules out bias
+        bias = None
+        affected = 0
         for metric in validation_results['overall']:
             if metric['csv'] > metric['fabric']:
-                biases.append('growth_higher')
+                current = 'growth_higher'
             elif metric['fabric'] > metric['csv']:
-                biases.append('fabric_higher')
-        
-        if len(biases) >= 2 and len(set(biases)) == 1:
-            direction = "Growth consistently higher" if biases[0] == 'growth_higher' else "Fabric consistently higher"
+                current = 'fabric_higher'
+            else:
+                continue
+            
+            if bias is None:
+                bias = current
+            elif current != bias:
+                return
+            affected += 1
+        
+        if affected >= 2:
+            direction = "Growth consistently higher" if bias == 'growth_higher' else "Fabric consistently higher"
             
             self.root_causes.append({
                 'type': 'systematic_bias',
                 'evidence': {
-                    'direction': biases[0],
-                    'affected_metrics': len(biases)
+                    'direction': bias,
+                    'affected_metrics': affected
                 },
                 'confidence': 0.85,
-                'description': f'{direction} across {len(biases)} metrics - check for systematic filter or aggregation difference.'
+                'description': f'{direction} across {affected} metrics - check for systematic filter or aggregation difference.'
             })
@@ -0,0 +1,36 @@
+"""
+JSON serialization helpers for validation payloads.
+orjson serializes numpy scalars/arrays natively in C - no recursive Python walk.
+"""
+import numpy as np
+import pandas as pd
+import orjson
+
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _orjson_default(obj):
+    """Fallback for values orjson can't serialize on its own (pandas NA/NaT, Timestamps)."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if pd.isna(obj):
+        return None
+    if isinstance(obj, pd.Timestamp):
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps_json(obj, indent: bool = False) -> bytes:
+    """Serialize validation payloads (numpy/pandas values included) to JSON bytes."""
+    option = ORJSON_OPTIONS | orjson.OPT_INDENT_2 if indent else ORJSON_OPTIONS
+    return orjson.dumps(obj, option=option, default=_orjson_default)
+
+
+def loads_json(data):
+    """Parse JSON bytes/str produced by dumps_json (or any client)."""
+    return orjson.loads(data)
+
+
+def convert_numpy_types(obj):
+    """Convert numpy types to native Python types for JSON serialization."""
+    return orjson.loads(dumps_json(obj))
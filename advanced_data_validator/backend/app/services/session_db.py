@@ -1,56 +1,114 @@
 """
 SQLite session database for storing and managing user sessions.
 """
+import atexit
+import calendar
 import sqlite3
 import os
+import threading
+import time
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Optional, Tuple
 from pathlib import Path
 
 # Database path
 DB_PATH = Path(__file__).parent.parent.parent / "sessions.db"
 
 
+# Expired-session cleanup runs off the request path in bounded batches
+CLEANUP_INTERVAL_SECONDS = 60
+CLEANUP_BATCH_SIZE = 1000
+_cleanup_lock = threading.Lock()
+_cleanup_thread: Optional[threading.Thread] = None
+_cleanup_stop = threading.Event()
+
+# One connection per thread, reused across requests (sqlite3 connections aren't thread-safe)
+_conn_local = threading.local()
+_all_connections = []
+_connections_lock = threading.Lock()
+
+
 def get_connection():
-    """Get a database connection."""
-    conn = sqlite3.connect(str(DB_PATH))
-    conn.row_factory = sqlite3.Row
+    """Get this thread's database connection, opening it on first use."""
+    conn = getattr(_conn_local, "conn", None)
+    if conn is None:
+        # check_same_thread=False only so _close_all can close it at exit
+        conn = sqlite3.connect(str(DB_PATH), check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        # WAL lets readers run alongside a writer; NORMAL sync is safe with WAL
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        # Checkpoint every ~1000 pages so the WAL file stays bounded
+        conn.execute("PRAGMA wal_autocheckpoint=1000")
+        _conn_local.conn = conn
+        with _connections_lock:
+            _all_connections.append(conn)
     return conn
 
 
+def _to_epoch(dt: datetime) -> int:
+    """UTC epoch seconds; naive datetimes are treated as UTC (we store utcnow())."""
+    return calendar.timegm(dt.utctimetuple())
+
+
+def _close_all():
+    """Close every thread's connection at interpreter exit."""
+    with _connections_lock:
+        for conn in _all_connections:
+            conn.close()
+        _all_connections.clear()
+
+
+atexit.register(_close_all)
+
+
 def init_db():
     """Initialize the sessions database."""
     conn = get_connection()
-    cursor = conn.cursor()
     
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS sessions (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            token TEXT UNIQUE NOT NULL,
-            username TEXT NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            expires_at TIMESTAMP NOT NULL
-        )
-    """)
+    with conn:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS sessions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                token TEXT UNIQUE NOT NULL,
+                username TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                expires_at INTEGER NOT NULL
+            )
+        """)
+        # Older databases stored ISO-8601 strings - convert them to epoch seconds
+        conn.execute("""
+            UPDATE sessions SET expires_at = CAST(strftime('%s', expires_at) AS INTEGER)
+            WHERE typeof(expires_at) = 'text'
+        """)
+        # Expiry cleanup is a range scan on expires_at
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_sessions_expires ON sessions(expires_at)
+        """)
     
-    conn.commit()
-    conn.close()
     print("✅ Sessions database initialized")
 
 
 def store_session(token: str, username: str, expires_at: datetime) -> bool:
     """Store a new session in the database."""
+    return store_sessions_bulk([(token, username, expires_at)])
+
+
+def store_sessions_bulk(sessions: Iterable[Tuple[str, str, datetime]]) -> bool:
+    """
+    Store many (token, username, expires_at) sessions in one transaction -
+    a single commit (and fsync) instead of one per row. All-or-nothing.
+    """
     try:
         conn = get_connection()
-        cursor = conn.cursor()
         
-        cursor.execute("""
-            INSERT INTO sessions (token, username, expires_at)
-            VALUES (?, ?, ?)
-        """, (token, username, expires_at.isoformat()))
+        with conn:
+            conn.executemany("""
+                INSERT INTO sessions (token, username, expires_at)
+                VALUES (?, ?, ?)
+            """, ((token, username, _to_epoch(expires_at)) for token, username, expires_at in sessions))
         
-        conn.commit()
-        conn.close()
         return True
     except Exception as e:
         print(f"Error storing session: {e}")
@@ -60,24 +118,17 @@ def store_session(token: str, username: str, expires_at: datetime) -> bool:
 def get_session(token: str) -> Optional[dict]:
     """Get a session by token."""
     conn = get_connection()
-    cursor = conn.cursor()
+    now = int(time.time())
     
-    cursor.execute("""
-        SELECT * FROM sessions WHERE token = ?
-    """, (token,))
-    
-    row = cursor.fetchone()
-    conn.close()
+    # Expiry is checked in the query itself - lookups stay read-only; expired rows
+    # are reclaimed by the background cleanup, not on the auth path
+    row = conn.execute("""
+        SELECT * FROM sessions WHERE token = ? AND expires_at >= ?
+    """, (token, now)).fetchone()
     
     if row is None:
         return None
     
-    # Check if session has expired
-    expires_at = datetime.fromisoformat(row["expires_at"])
-    if datetime.utcnow() > expires_at:
-        delete_session(token)
-        return None
-    
     return dict(row)
 
 
@@ -85,38 +136,70 @@ def delete_session(token: str) -> bool:
     """Delete a session (logout)."""
     try:
         conn = get_connection()
-        cursor = conn.cursor()
         
-        cursor.execute("""
-            DELETE FROM sessions WHERE token = ?
-        """, (token,))
+        with conn:
+            conn.execute("""
+                DELETE FROM sessions WHERE token = ?
+            """, (token,))
         
-        conn.commit()
-        conn.close()
         return True
     except Exception as e:
         print(f"Error deleting session: {e}")
         return False
 
 
-def cleanup_expired_sessions() -> int:
-    """Remove all expired sessions. Returns count of deleted sessions."""
+def cleanup_expired_sessions(batch_size: int = CLEANUP_BATCH_SIZE) -> int:
+    """
+    Remove all expired sessions. Returns count of deleted sessions.
+    Deletes in bounded batches so each write lock is held only briefly.
+    """
+    # Single writer - a concurrent run would only fight over the same rows
+    if not _cleanup_lock.acquire(blocking=False):
+        return 0
+    
     try:
         conn = get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            DELETE FROM sessions WHERE expires_at < ?
-        """, (datetime.utcnow().isoformat(),))
+        now = int(time.time())
+        deleted_count = 0
         
-        deleted_count = cursor.rowcount
-        conn.commit()
-        conn.close()
+        while True:
+            with conn:
+                cursor = conn.execute("""
+                    DELETE FROM sessions WHERE rowid IN (
+                        SELECT rowid FROM sessions WHERE expires_at < ? LIMIT ?
+                    )
+                """, (now, batch_size))
+            deleted_count += cursor.rowcount
+            if cursor.rowcount < batch_size:
+                break
         
         return deleted_count
     except Exception as e:
         print(f"Error cleaning up sessions: {e}")
         return 0
+    finally:
+        _cleanup_lock.release()
+
+
+def _cleanup_loop(interval_seconds: int):
+    """Scheduler thread body: clean up every interval until stopped."""
+    while not _cleanup_stop.wait(interval_seconds):
+        cleanup_expired_sessions()
+
+
+def start_cleanup_scheduler(interval_seconds: int = CLEANUP_INTERVAL_SECONDS):
+    """
+    Purge expired sessions periodically on a background thread (idempotent).
+    One long-lived thread, so it reuses a single thread-local connection.
+    """
+    global _cleanup_thread
+    if _cleanup_thread is not None:
+        return
+    
+    _cleanup_thread = threading.Thread(
+        target=_cleanup_loop, args=(interval_seconds,), name="session-cleanup", daemon=True
+    )
+    _cleanup_thread.start()
 
 
 # Initialize database on import
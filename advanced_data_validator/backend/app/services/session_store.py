@@ -0,0 +1,86 @@
+"""
+Validation session store.
+Holds per-session validation results either in process memory (default) or in
+Redis, so several uvicorn workers can serve the same session.
+Select the backend with SESSION_BACKEND=memory|redis.
+"""
+import os
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from .serialization import dumps_json, loads_json
+
+SESSION_BACKEND = os.getenv("SESSION_BACKEND", "memory").lower()
+SESSION_TTL_SECONDS = int(os.getenv("SESSION_TTL_SECONDS", 60 * 60))  # 1 hour
+MAX_MEMORY_SESSIONS = int(os.getenv("MAX_MEMORY_SESSIONS", 100))
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+
+class MemorySessionStore:
+    """
+    In-process LRU store with expiry.
+    Bounded so long-running workers don't grow forever.
+    """
+
+    def __init__(self, ttl_seconds: int = SESSION_TTL_SECONDS, max_sessions: int = MAX_MEMORY_SESSIONS):
+        self.ttl_seconds = ttl_seconds
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, session_id: str) -> Optional[dict]:
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            return None
+
+        expires_at, payload = entry
+        if time.monotonic() > expires_at:
+            del self._sessions[session_id]
+            return None
+
+        self._sessions.move_to_end(session_id)
+        return payload
+
+    def set(self, session_id: str, payload: dict):
+        self._sessions[session_id] = (time.monotonic() + self.ttl_seconds, payload)
+        self._sessions.move_to_end(session_id)
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+
+    def delete(self, session_id: str):
+        self._sessions.pop(session_id, None)
+
+
+class RedisSessionStore:
+    """
+    Redis-backed store; payloads are stored as orjson-encoded bytes with a TTL.
+    Requires the `redis` package (pip install redis).
+    """
+
+    KEY_PREFIX = "sess:"
+
+    def __init__(self, url: str = REDIS_URL, ttl_seconds: int = SESSION_TTL_SECONDS):
+        import redis
+
+        self.client = redis.Redis.from_url(url)
+        self.ttl_seconds = ttl_seconds
+
+    def get(self, session_id: str) -> Optional[dict]:
+        raw = self.client.get(self.KEY_PREFIX + session_id)
+        if raw is None:
+            return None
+        return loads_json(raw)
+
+    def set(self, session_id: str, payload: dict):
+        self.client.set(self.KEY_PREFIX + session_id, dumps_json(payload), ex=self.ttl_seconds)
+
+    def delete(self, session_id: str):
+        self.client.delete(self.KEY_PREFIX + session_id)
+
+
+def create_session_store():
+    """Build the session store selected by SESSION_BACKEND."""
+    if SESSION_BACKEND == "redis":
+        print(f"🗄️ Using Redis session store at {REDIS_URL}")
+        return RedisSessionStore()
+    return MemorySessionStore()
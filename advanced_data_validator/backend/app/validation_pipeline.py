@@ -0,0 +1,75 @@
+"""
+Validation pipeline run inside the worker processes.
+Kept apart from main.py so importing it in a worker doesn't open the sessions
+database or start the cleanup scheduler.
+"""
+import logging
+import os
+import time
+from typing import Optional
+
+from .validator_engine import ValidatorEngine
+from .services.column_mapper import ColumnMapper
+from .services.root_cause_engine import RootCauseEngine
+from .services.fix_suggestion_engine import FixSuggestionEngine
+
+logger = logging.getLogger(__name__)
+
+
+class DataLoadError(Exception):
+    """Raised by the validation pipeline when the uploaded files can't be loaded."""
+
+
+def init_worker():
+    """Process-pool initializer: apply the API's LOG_LEVEL in the fresh worker."""
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "WARNING").upper())
+
+
+def run_validation_pipeline(growth_path: str, gold_path: str, threshold: float,
+                            growth_mappings: Optional[dict] = None,
+                            gold_mappings: Optional[dict] = None) -> dict:
+    """
+    Load, validate, analyze and suggest fixes for one pair of files.
+    Top-level (picklable) so it can run in the validation process pool.
+    Column auto-mapping only runs when no custom mappings were supplied.
+    """
+    engine = ValidatorEngine(
+        threshold_percent=threshold,
+        custom_column_mappings=growth_mappings,
+        gold_column_mappings=gold_mappings
+    )
+    try:
+        engine.load_data(growth_path, gold_path)  # Note: growth is CSV, gold is Fabric
+    except Exception as e:
+        raise DataLoadError(str(e)) from e
+
+    # PHASE 3: Column Mapping
+    column_mappings, mapping_warnings = None, []
+    if growth_mappings is None and gold_mappings is None:
+        mapper = ColumnMapper(engine.csv_df, engine.fabric_df)
+        column_mappings = mapper.auto_map()
+        mapping_warnings = mapper.validate_mapping(column_mappings)
+
+    start_time = time.time()
+
+    # Run validation (summary counts are gathered during the same pass)
+    results, summary = engine.validate_and_summarize()
+
+    # PHASE 6: Root Cause Analysis
+    root_cause_engine = RootCauseEngine(engine.csv_df, engine.fabric_df)
+    root_causes = root_cause_engine.analyze(results)
+
+    # PHASE 7: Fix Suggestions
+    fixes = FixSuggestionEngine.generate_fixes(root_causes)
+
+    duration = time.time() - start_time
+    logger.info("⏱️ Validation completed in %.2fs", duration)
+
+    return {
+        "summary": summary,
+        "results": results,
+        "column_mappings": column_mappings,
+        "mapping_warnings": mapping_warnings,
+        "root_causes": root_causes,
+        "fixes": fixes
+    }
@@ -1,9 +1,72 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime
+import csv
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 import json
+import logging
+import re
 from typing import Dict, List, Optional
 from io import StringIO
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+from .services import parse_cache
+
+logger = logging.getLogger(__name__)
+
+# Header keywords that tell a real data header apart from report metadata lines
+CSV_DATA_KEYWORDS = ['campaign', 'cost', 'impr', 'click', 'day', 'date', 'spend']
+# Leading rows to try skipping (Google Ads exports put 2 metadata lines above the header)
+CSV_SKIPROWS_CANDIDATES = [0, 2, 1, 3]
+# Thousand separators, currency symbols and percent signs stripped from numeric columns
+NUMERIC_STRIP_PATTERN = r'[,₹$€£¥%]'
+# What's left after stripping must look like a number (RE2 syntax, for pyarrow.compute)
+NUMBER_PATTERN = r'(?i)^[+-]?((\d+\.?\d*|\.\d+)(e[+-]?\d+)?|inf|infinity|nan)$'
+INTEGER_PATTERN = r'^[+-]?\d+$'
+# Blank/missing spellings read as 0 before parsing, so gaps don't turn an integer column into floats
+NUMERIC_ZERO_TOKENS = ['', 'nan', 'NaN', 'none', 'None', '-']
+# Columns the segment validators group by
+SEGMENT_KEY_COLUMNS = ['campaign_name', 'day', 'platform', 'placement', 'device', 'gender', 'age']
+# Metrics that decide a segment row's pass/fail
+BASE_MATCH_METRICS = ['cost', 'impressions', 'clicks']
+
+# Keyword-based column normalization rules (from all three notebooks)
+COLUMN_RULES = {
+    # Cost mappings: Amount spent (INR), spend_cost, Cost
+    'cost': ['cost', 'spend', 'amount', 'price', 'total_cost', 'amount spent', 
+             'amount spent (inr)', 'spend_cost', 'investment'],
+    # Impressions mappings: Impr., impressions  
+    'impressions': ['impressions', 'impr', 'impr.', 'views', 'impression', 'imp'],
+    # Clicks mappings: Link clicks, Clicks (all), clicks
+    'clicks': ['clicks', 'click', 'total_clicks', 'link clicks', 'clicks (all)', 
+               'outbound clicks'],
+    # Campaign mappings: Campaign name, campaign_name, Campaign
+    'campaign_name': ['campaign_name', 'campaign', 'campaign name', 'campaignnames', 
+                      'campaign_id', 'ad set name', 'ad set'],
+    # Date mappings: Day, date, Reporting starts
+    'day': ['day', 'date', 'dt', 'timestamp', 'reporting starts', 'reporting ends', 
+            'period', 'month'],
+    'gender': ['gender', 'sex', 'consumer_gender'],
+    'age': ['age', 'age_range', 'agerange', 'age range', 'consumer_age'],
+    'platform': ['platform', 'publisher_platform'],
+    'placement': ['placement', 'placement_name', 'impression_device'],
+    'device': ['device', 'device_type', 'device type'],
+    # Reach mapping: Reach (Growth) --> reach (Gold)
+    'reach': ['reach', 'total_reach', 'unique_reach'],
+    # Purchases mapping: Purchases (Growth) --> purchases_conversions (Gold)
+    'purchases': ['purchases', 'purchases_conversions', 'conversions', 'purchase', 
+                 'total_purchases', 'purchases_total'],
+    # Conversion Value mapping: Purchases conversion value (Growth) --> conversion_value (Gold)
+    'conversion_value': ['conversion_value', 'purchases conversion value', 'purchase_value',
+                        'total_conversion_value', 'conv_value', 'value']
+}
+# One alternation per standard name: a single scan tells whether a column contains any of its keywords
+COLUMN_RULE_PATTERNS = {
+    standard_name: re.compile('|'.join(re.escape(kw.lower()) for kw in keywords))
+    for standard_name, keywords in COLUMN_RULES.items()
+}
 
 class ValidatorEngine:
     def __init__(self, threshold_percent: float = 3.0, custom_column_mappings: dict = None, gold_column_mappings: dict = None):
@@ -13,20 +76,158 @@ class ValidatorEngine:
         self.csv_df = None
         self.fabric_df = None
         self.raw_results = {}
+        self.segment_counts = {}  # segment -> (total, matches), filled during validation
+        self._metrics_cache = None  # common numeric columns, computed once per validation run
+        self._base_aggs = None  # (keys, growth sums, gold sums) at the finest segment grain, per validation run
 
     def _read_file(self, file_path: str) -> pd.DataFrame:
         """Universal file reader with maximum error tolerance for CSV, XLSX, XLS."""
         file_ext = file_path.lower().split('.')[-1]
+        if file_ext not in ['csv', 'xlsx', 'xls']:
+            raise ValueError(f"Unsupported format: {file_ext}. Use CSV, XLSX, or XLS")
+        
+        # Same file parsed before (re-run / re-upload): reuse the parquet sidecar
+        key = parse_cache.cache_key(file_path)
+        df = parse_cache.load_cached(key)
+        if df is not None:
+            logger.debug("✓ Loaded from parse cache: %d rows × %d columns", len(df), len(df.columns))
+            return df
         
         if file_ext == 'csv':
-            return self._read_csv_robust(file_path)
-        elif file_ext in ['xlsx', 'xls']:
-            return self._read_excel_robust(file_path)
+            df = self._read_csv_robust(file_path)
         else:
-            raise ValueError(f"Unsupported format: {file_ext}. Use CSV, XLSX, or XLS")
+            df = self._read_excel_robust(file_path)
+        parse_cache.store_cached(key, df)
+        return df
+    
+    def _read_csv_arrow(self, file_path: str) -> Optional[pd.DataFrame]:
+        """Fast path: multithreaded PyArrow CSV parse of clean UTF-8 files. Returns None if unusable."""
+        # Sniff the header row from the first lines so the usual case is a single full parse
+        detected = self._detect_header_row(file_path, 'utf-8')
+        if detected is None:
+            return None
+        candidates = [detected] + [n for n in CSV_SKIPROWS_CANDIDATES if n != detected]
+        
+        short_rows = []
+        
+        def handle_invalid_row(row):
+            # pandas drops rows with extra fields but keeps short ones (padded with NaN); pyarrow
+            # can't pad, so a short row sends the whole file to the pandas readers
+            if row.actual_columns > row.expected_columns:
+                return 'skip'
+            short_rows.append(row.number)
+            return 'error'
+        
+        for skiprows in candidates:
+            try:
+                table = pa_csv.read_csv(
+                    file_path,
+                    read_options=pa_csv.ReadOptions(skip_rows=skiprows),
+                    parse_options=pa_csv.ParseOptions(invalid_row_handler=handle_invalid_row),
+                    convert_options=pa_csv.ConvertOptions(strings_can_be_null=True)
+                )
+            except Exception:
+                if short_rows:
+                    return None
+                continue
+            
+            # Non-UTF-8 text comes back as binary columns - leave those files to the pandas readers
+            if any(pa.types.is_binary(field.type) for field in table.schema):
+                return None
+            
+            # Keep dates as text like the pandas parsers do; they're normalized in load_data
+            for i, field in enumerate(table.schema):
+                if pa.types.is_temporal(field.type):
+                    table = table.set_column(i, field.name, table.column(i).cast(pa.string()))
+            
+            # Match pandas' naming of blank headers; bail out on duplicates pandas would mangle
+            names = [name if name.strip() else f'Unnamed: {i}' for i, name in enumerate(table.column_names)]
+            if len(set(names)) != len(names):
+                return None
+            
+            # Hand Arrow buffers over column by column instead of holding both copies at peak
+            df = table.rename_columns(names).to_pandas(split_blocks=True, self_destruct=True)
+            del table
+            df = self._nulls_to_nan(df)
+            if not df.empty:
+                # Check if we got valid data (not metadata headers)
+                cols_lower = [str(c).lower() for c in df.columns]
+                has_data_cols = any(kw in ' '.join(cols_lower) for kw in 
+                    ['campaign', 'cost', 'impr', 'click', 'day', 'date', 'spend'])
+                
+                if has_data_cols:
+                    logger.debug("✓ CSV loaded with pyarrow (skiprows=%d)", skiprows)
+                    return self._clean_dataframe(df)
+        return None
+    
+    @staticmethod
+    def _detect_encoding(file_path: str, sample_size: int = 32768) -> str:
+        """Pick the CSV encoding from a byte sample: BOMs and NUL bytes mark UTF-8-sig/UTF-16."""
+        with open(file_path, 'rb') as f:
+            sample = f.read(sample_size)
+        
+        if sample.startswith(b'\xef\xbb\xbf'):
+            return 'utf-8-sig'
+        if sample.startswith((b'\xff\xfe', b'\xfe\xff')) or b'\x00' in sample:
+            return 'utf-16'
+        # Anything else is read as UTF-8, dropping undecodable bytes (as the fallback loop does)
+        return 'utf-8'
+    
+    @staticmethod
+    def _detect_header_row(file_path: str, encoding: str, max_lines: int = 15) -> Optional[int]:
+        """Find how many leading rows to skip so the header holds data keywords, from the first lines only."""
+        with open(file_path, encoding=encoding, errors='ignore', newline='') as f:
+            lines = list(itertools.islice(f, max_lines))
+        
+        for skiprows in CSV_SKIPROWS_CANDIDATES:
+            # pandas skips blank lines before the header, so do the same
+            header = next((line for line in lines[skiprows:] if line.strip()), None)
+            if header is None:
+                continue
+            tokens = next(csv.reader([header]), [])
+            if any(kw in ' '.join(tokens).lower() for kw in CSV_DATA_KEYWORDS):
+                return skiprows
+        return None
+    
+    def _read_csv_detected(self, file_path: str) -> Optional[pd.DataFrame]:
+        """One C-engine parse with the encoding and header row sniffed up front. Returns None if unusable."""
+        try:
+            encoding = self._detect_encoding(file_path)
+            skiprows = self._detect_header_row(file_path, encoding)
+            if skiprows is None:
+                return None
+            
+            df = pd.read_csv(
+                file_path,
+                encoding=encoding,
+                encoding_errors='ignore',
+                skiprows=skiprows,
+                on_bad_lines='skip',
+                engine='c',
+                low_memory=False
+            )
+        except Exception:
+            return None
+        
+        cols_lower = [str(c).lower() for c in df.columns]
+        if df.empty or not any(kw in ' '.join(cols_lower) for kw in CSV_DATA_KEYWORDS):
+            return None
+        
+        logger.debug("✓ CSV loaded with %s encoding (skiprows=%d)", encoding, skiprows)
+        return self._clean_dataframe(df)
     
     def _read_csv_robust(self, file_path: str) -> pd.DataFrame:
         """Ultra-robust CSV reader with multiple fallback strategies."""
+        df = self._read_csv_arrow(file_path)
+        if df is not None:
+            return df
+        
+        # Non-UTF-8 / awkward files: sniff encoding + header once, then a single C-engine parse
+        df = self._read_csv_detected(file_path)
+        if df is not None:
+            return df
+        
+        # Last resort: brute-force encodings x skiprows with the (slow) python engine
         # Try different encodings in order of likelihood
         encodings = ['utf-8', 'latin-1', 'iso-8859-1', 'cp1252', 'utf-16', 'utf-8-sig']
         
@@ -49,7 +250,7 @@ class ValidatorEngine:
                             ['campaign', 'cost', 'impr', 'click', 'day', 'date', 'spend'])
                         
                         if has_data_cols:
-                            print(f"✓ CSV loaded with {encoding} encoding (skiprows={skiprows})")
+                            logger.debug("✓ CSV loaded with %s encoding (skiprows=%d)", encoding, skiprows)
                             return self._clean_dataframe(df)
                 except Exception as e:
                     continue
@@ -75,7 +276,7 @@ class ValidatorEngine:
                     has_data_cols = any(kw in ' '.join(cols_lower) for kw in 
                         ['campaign', 'cost', 'impr', 'click', 'day', 'date', 'spend'])
                     if has_data_cols:
-                        print(f"✓ CSV loaded with binary fallback (skiprows={skiprows})")
+                        logger.debug("✓ CSV loaded with binary fallback (skiprows=%d)", skiprows)
                         return self._clean_dataframe(df)
                 except:
                     continue
@@ -86,22 +287,17 @@ class ValidatorEngine:
     
     def _read_excel_robust(self, file_path: str) -> pd.DataFrame:
         """Robust Excel reader."""
-        file_ext = file_path.lower().split('.')[-1]
-        
         try:
-            if file_ext == 'xlsx':
-                df = pd.read_excel(file_path, engine='openpyxl')
-            else:
-                df = pd.read_excel(file_path)
+            # calamine (Rust) parses both XLSX and XLS several times faster than openpyxl/xlrd
+            df = pd.read_excel(file_path, engine='calamine')
             
-            print(f"✓ Excel loaded successfully")
+            logger.debug("✓ Excel loaded successfully")
             return self._clean_dataframe(df)
         except Exception as e:
-            # Try reading first sheet explicitly
+            # Try reading first sheet explicitly with pandas' default engine (openpyxl/xlrd)
             try:
-                excel_file = pd.ExcelFile(file_path)
-                df = pd.read_excel(excel_file, sheet_name=0)
-                print(f"✓ Excel loaded (first sheet)")
+                df = pd.read_excel(file_path, sheet_name=0)
+                logger.debug("✓ Excel loaded (first sheet)")
                 return self._clean_dataframe(df)
             except:
                 raise ValueError(f"Could not read Excel: {str(e)}")
@@ -118,18 +314,20 @@ class ValidatorEngine:
         # Remove 'Unnamed' columns
         df = df.loc[:, ~df.columns.str.contains('^unnamed', case=False)]
         
-        print(f"✓ Loaded: {len(df)} rows × {len(df.columns)} columns")
-        print(f"  Columns: {', '.join(df.columns[:5])}" + ("..." if len(df.columns) > 5 else ""))
+        logger.debug("✓ Loaded: %d rows × %d columns", len(df), len(df.columns))
+        logger.debug("  Columns: %s%s", ', '.join(df.columns[:5]), "..." if len(df.columns) > 5 else "")
         
         return df
     
     def load_data(self, csv_file_path: str, fabric_file_path: str):
         """Loads and prepares the dataframes."""
-        print(f"\n🔄 Loading Growth file...")
-        self.csv_df = self._read_file(csv_file_path)
-        
-        print(f"\n🔄 Loading Gold file...")
-        self.fabric_df = self._read_file(fabric_file_path)
+        logger.debug("🔄 Loading Growth and Gold files...")
+        # The two parses are independent and mostly GIL-free (pyarrow / C parser / calamine), so overlap them
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            csv_future = pool.submit(self._read_file, csv_file_path)
+            fabric_future = pool.submit(self._read_file, fabric_file_path)
+            self.csv_df = csv_future.result()
+            self.fabric_df = fabric_future.result()
         
         # Auto-detect and normalize column names FIRST
         self._normalize_columns()
@@ -138,8 +336,7 @@ class ValidatorEngine:
         for df_name, df in [('Growth', self.csv_df), ('Gold', self.fabric_df)]:
             # Clean 'day' column
             if 'day' in df.columns:
-                df['day'] = pd.to_datetime(df['day'], errors='coerce').dt.strftime('%Y-%m-%d')
-                df['day'] = df['day'].fillna('1970-01-01')
+                df['day'] = self._normalize_dates(df['day'])
             
             # Clean 'campaign_name' - strip whitespace and convert to string for robust matching
             if 'campaign_name' in df.columns:
@@ -149,62 +346,78 @@ class ValidatorEngine:
             # Handles: commas (24,118), currency symbols ($100), percentages (50%), whitespace
             numeric_cols = ['cost', 'impressions', 'clicks', 'reach', 'purchases', 'conversion_value']
             for col in numeric_cols:
-                if col in df.columns:
-                    # Convert to string first for consistent cleaning
-                    df[col] = df[col].astype(str)
-                    # Remove commas (thousand separators)
-                    df[col] = df[col].str.replace(',', '', regex=False)
-                    # Remove currency symbols (₹, $, €, etc.)
-                    df[col] = df[col].str.replace(r'[₹$€£¥]', '', regex=True)
-                    # Remove percentage signs
-                    df[col] = df[col].str.replace('%', '', regex=False)
-                    # Remove whitespace
-                    df[col] = df[col].str.strip()
-                    # Handle empty strings and 'nan' strings
-                    df[col] = df[col].replace(['', 'nan', 'NaN', 'none', 'None', '-'], '0')
-                    # Convert to numeric
-                    df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
+                if col not in df.columns:
+                    continue
+                if df[col].dtype.kind in 'iuf':
+                    # Already parsed as numbers (pyarrow/Excel) - nothing to strip, skip the str round-trip
+                    df[col] = df[col].fillna(0)
+                    continue
+                df[col] = self._clean_numeric(df[col])
             
             # Log summary for debugging
             if numeric_cols:
                 available = [c for c in numeric_cols if c in df.columns]
                 if available:
-                    print(f"  📊 {df_name} numeric columns cleaned: {available}")
+                    logger.debug("  📊 %s numeric columns cleaned: %s", df_name, available)
         
-        print(f"\n✅ Data loaded successfully!\n")
+        logger.debug("✅ Data loaded successfully!")
+    
+    @staticmethod
+    def _map_distinct(values: pd.Series, transform) -> pd.Series:
+        """Apply a Series -> Series `transform` to the distinct values only, then expand back by code."""
+        # Key columns repeat a handful of values over many rows, so the per-row work shrinks to per-unique
+        codes, uniques = pd.factorize(values, use_na_sentinel=False)
+        mapped = transform(pd.Series(uniques)).take(codes)
+        mapped.index = values.index
+        return mapped.rename(values.name)
+    
+    @classmethod
+    def _normalize_dates(cls, days: pd.Series) -> pd.Series:
+        """Parse dates to 'YYYY-MM-DD' (unparseable -> 1970-01-01), once per distinct value."""
+        return cls._map_distinct(
+            days,
+            lambda u: pd.to_datetime(u, errors='coerce').dt.strftime('%Y-%m-%d').fillna('1970-01-01')
+        )
+    
+    @staticmethod
+    def _nulls_to_nan(df: pd.DataFrame) -> pd.DataFrame:
+        """Arrow nulls in text columns come back as None; the pandas readers give NaN (-> 'nan' labels)."""
+        for col in df.columns[df.dtypes == object]:
+            df[col] = df[col].where(df[col].notna(), np.nan)
+        return df
+    
+    @staticmethod
+    def _clean_numeric(values: pd.Series) -> pd.Series:
+        """
+        Strip separators/currency/percent and parse to numbers; blanks ('', 'nan', 'None', '-')
+        and anything else unparseable become 0. Runs in Arrow compute kernels end to end.
+        """
+        try:
+            arr = pa.array(values.astype(str), type=pa.string(), from_pandas=True)
+            arr = pc.utf8_trim_whitespace(pc.replace_substring_regex(arr, NUMERIC_STRIP_PATTERN, ''))
+            arr = pc.if_else(pc.is_in(arr, value_set=pa.array(NUMERIC_ZERO_TOKENS)), '0', arr)
+            # Null out what isn't a number so the cast coerces instead of raising
+            is_number = pc.match_substring_regex(arr, NUMBER_PATTERN)
+            arr = pc.if_else(is_number, arr, pa.scalar(None, pa.string()))
+            
+            # Like pd.to_numeric: all-integer columns without gaps stay int64
+            if arr.null_count == 0 and pc.all(pc.match_substring_regex(arr, INTEGER_PATTERN)).as_py() is not False:
+                parsed = pc.cast(arr, pa.int64())
+            else:
+                parsed = pc.fill_null(pc.cast(arr, pa.float64()), 0.0)
+            numbers = parsed.to_numpy(zero_copy_only=False)
+        except pa.ArrowException:
+            # e.g. integers beyond int64 - let pandas pick the dtype
+            cleaned = values.astype(str).str.replace(NUMERIC_STRIP_PATTERN, '', regex=True).str.strip()
+            cleaned = cleaned.replace(NUMERIC_ZERO_TOKENS, '0')
+            return pd.to_numeric(cleaned, errors='coerce').fillna(0)
+        
+        # NaN/inf spelled out in the data parse like to_numeric; NaN still means 0
+        return pd.Series(numbers, index=values.index, name=values.name).fillna(0)
     
     def _normalize_columns(self):
         """Intelligent column detection using fuzzy patterns and keyword matching."""
-        # Define keyword-based normalization rules (from all three notebooks)
-        rules = {
-            # Cost mappings: Amount spent (INR), spend_cost, Cost
-            'cost': ['cost', 'spend', 'amount', 'price', 'total_cost', 'amount spent', 
-                     'amount spent (inr)', 'spend_cost', 'investment'],
-            # Impressions mappings: Impr., impressions  
-            'impressions': ['impressions', 'impr', 'impr.', 'views', 'impression', 'imp'],
-            # Clicks mappings: Link clicks, Clicks (all), clicks
-            'clicks': ['clicks', 'click', 'total_clicks', 'link clicks', 'clicks (all)', 
-                       'outbound clicks'],
-            # Campaign mappings: Campaign name, campaign_name, Campaign
-            'campaign_name': ['campaign_name', 'campaign', 'campaign name', 'campaignnames', 
-                              'campaign_id', 'ad set name', 'ad set'],
-            # Date mappings: Day, date, Reporting starts
-            'day': ['day', 'date', 'dt', 'timestamp', 'reporting starts', 'reporting ends', 
-                    'period', 'month'],
-            'gender': ['gender', 'sex', 'consumer_gender'],
-            'age': ['age', 'age_range', 'agerange', 'age range', 'consumer_age'],
-            'platform': ['platform', 'publisher_platform'],
-            'placement': ['placement', 'placement_name', 'impression_device'],
-            'device': ['device', 'device_type', 'device type'],
-            # Reach mapping: Reach (Growth) --> reach (Gold)
-            'reach': ['reach', 'total_reach', 'unique_reach'],
-            # Purchases mapping: Purchases (Growth) --> purchases_conversions (Gold)
-            'purchases': ['purchases', 'purchases_conversions', 'conversions', 'purchase', 
-                         'total_purchases', 'purchases_total'],
-            # Conversion Value mapping: Purchases conversion value (Growth) --> conversion_value (Gold)
-            'conversion_value': ['conversion_value', 'purchases conversion value', 'purchase_value',
-                                'total_conversion_value', 'conv_value', 'value']
-        }
+        rules = COLUMN_RULES
         
         # Placement normalization map (complete from notebooks)
         self.placement_mapping = {
@@ -254,33 +467,35 @@ class ValidatorEngine:
         for df_name, df in [('Growth', self.csv_df), ('Gold', self.fabric_df)]:
             renamed_cols = {}
             current_cols = [str(c).lower() for c in df.columns]
+            # Lowercased name -> first original column with that name (O(1) exact lookups)
+            lower_to_orig = {}
+            for lower, orig in zip(current_cols, df.columns):
+                lower_to_orig.setdefault(lower, orig)
             already_mapped_targets = set()  # Track which targets are already mapped by user
             
             # FIRST: Apply user-defined custom column mappings (if any) - these take precedence
             if df_name == 'Growth' and self.custom_column_mappings:
-                print(f"📋 Applying Growth custom mappings: {self.custom_column_mappings}")
+                logger.debug("📋 Applying Growth custom mappings: %s", self.custom_column_mappings)
                 for target_col, source_col in self.custom_column_mappings.items():
                     if source_col:  # Only if a source column was specified
                         # Find the original column (case-insensitive)
-                        for orig_col in df.columns:
-                            if str(orig_col).lower() == source_col.lower():
-                                renamed_cols[orig_col] = target_col
-                                already_mapped_targets.add(target_col)
-                                print(f"   ✓ {orig_col} → {target_col}")
-                                break
+                        orig_col = lower_to_orig.get(source_col.lower())
+                        if orig_col is not None:
+                            renamed_cols[orig_col] = target_col
+                            already_mapped_targets.add(target_col)
+                            logger.debug("   ✓ %s → %s", orig_col, target_col)
             
             # Apply Gold column mappings (if any)
             if df_name == 'Gold' and self.gold_column_mappings:
-                print(f"📋 Applying Gold custom mappings: {self.gold_column_mappings}")
+                logger.debug("📋 Applying Gold custom mappings: %s", self.gold_column_mappings)
                 for target_col, source_col in self.gold_column_mappings.items():
                     if source_col:  # Only if a source column was specified
                         # Find the original column (case-insensitive)
-                        for orig_col in df.columns:
-                            if str(orig_col).lower() == source_col.lower():
-                                renamed_cols[orig_col] = target_col
-                                already_mapped_targets.add(target_col)
-                                print(f"   ✓ {orig_col} → {target_col}")
-                                break
+                        orig_col = lower_to_orig.get(source_col.lower())
+                        if orig_col is not None:
+                            renamed_cols[orig_col] = target_col
+                            already_mapped_targets.add(target_col)
+                            logger.debug("   ✓ %s → %s", orig_col, target_col)
             
             # SECOND: Auto-detect only for columns NOT already mapped by user
             for standard_name, keywords in rules.items():
@@ -293,41 +508,43 @@ class ValidatorEngine:
                 # Try exact keyword match first
                 found = False
                 for kw in keywords:
-                    if kw.lower() in current_cols:
-                        original_col = df.columns[current_cols.index(kw.lower())]
+                    original_col = lower_to_orig.get(kw.lower())
+                    if original_col is not None:
                         renamed_cols[original_col] = standard_name
                         found = True
                         break
                 
                 # If not found, try partial match (keyword contained in column name)
                 if not found:
+                    # Narrow to columns containing any keyword, then keep keyword priority among them
+                    pattern = COLUMN_RULE_PATTERNS[standard_name]
+                    candidates = [(lower, orig) for lower, orig in zip(current_cols, df.columns) if pattern.search(lower)]
                     for kw in keywords:
-                        for original_col in df.columns:
-                            col_lower = str(original_col).lower()
-                            if kw.lower() in col_lower:
-                                renamed_cols[original_col] = standard_name
-                                found = True
-                                break
-                        if found: break
+                        kw_lower = kw.lower()
+                        original_col = next((orig for lower, orig in candidates if kw_lower in lower), None)
+                        if original_col is not None:
+                            renamed_cols[original_col] = standard_name
+                            break
             
             # Rename columns
             if renamed_cols:
                 df.rename(columns=renamed_cols, inplace=True)
-                print(f"  📝 {df_name} Normalized mappings:")
+                logger.debug("  📝 %s Normalized mappings:", df_name)
                 for orig, new in renamed_cols.items():
-                    print(f"      '{orig}' → '{new}'")
+                    logger.debug("      '%s' → '%s'", orig, new)
             
             # Apply placement normalization if column exists
             if 'placement' in df.columns:
-                df['placement'] = df['placement'].replace(self.placement_mapping)
-                print(f"  ✨ {df_name} placement names normalized")
+                df['placement'] = self._map_distinct(df['placement'], lambda u: u.replace(self.placement_mapping))
+                logger.debug("  ✨ %s placement names normalized", df_name)
             
             # Apply device normalization if column exists
             if 'device' in df.columns:
-                df['device'] = df['device'].replace(self.device_mapping)
-                # Also uppercase any unmapped devices
-                df['device'] = df['device'].fillna('OTHER').str.upper()
-                print(f"  ✨ {df_name} device names normalized")
+                # Map known device names, then uppercase any unmapped devices
+                df['device'] = self._map_distinct(
+                    df['device'], lambda u: u.replace(self.device_mapping).fillna('OTHER').str.upper()
+                )
+                logger.debug("  ✨ %s device names normalized", df_name)
         
         # DYNAMIC validation check - just ensure we have at least some common columns
         # No longer require specific columns - let user map whatever they want
@@ -340,18 +557,22 @@ class ValidatorEngine:
         fab_numeric = set(self.fabric_df.select_dtypes(include=['int64', 'float64', 'int32', 'float32']).columns)
         common_numeric = csv_numeric & fab_numeric
         
-        print(f"  📊 Common columns: {len(common_cols)}, Common numeric: {len(common_numeric)}")
+        logger.debug("  📊 Common columns: %d, Common numeric: %d", len(common_cols), len(common_numeric))
         
         if len(common_numeric) == 0:
-            print(f"⚠️ Warning: No common numeric columns found for validation")
-            print(f"   Growth numeric: {csv_numeric}")
-            print(f"   Gold numeric: {fab_numeric}")
+            logger.warning(
+                "⚠️ No common numeric columns found for validation (Growth numeric: %s, Gold numeric: %s)",
+                csv_numeric, fab_numeric
+            )
         
     def validate_all(self) -> Dict:
         """Runs all validation segments (comprehensive from all notebooks)."""
         if self.csv_df is None or self.fabric_df is None:
             raise ValueError("Data not loaded. Call load_data() first.")
 
+        self.segment_counts = {}
+        self._metrics_cache = None  # frames may have been replaced since the last run
+        self._base_aggs = self._build_base_aggregates()
         results = {
             # Core validations
             "overall": self._validate_overall(),
@@ -370,37 +591,92 @@ class ValidatorEngine:
             "by_camp_gender": self._validate_by_campaign_gender(),
             "by_date_gender_age": self._validate_by_date_gender_age()
         }
+        self._base_aggs = None
         self.raw_results = results
         return results
 
-    def _vectorized_match(self, s_csv, s_fab):
-        """Vectorized version of _check_match for performance."""
-        # Convert to numeric and ensure we have Series
-        s_csv = pd.to_numeric(s_csv, errors='coerce')
-        s_fab = pd.to_numeric(s_fab, errors='coerce')
-        
-        # Handle NA - force to 0 if we want to compare, but keep mask for exact NA filtering
-        mask_na = s_csv.isna() | s_fab.isna()
-        
-        # We fill with 0 to avoid errors in arithmetic, but rely on masks for logic
-        s_csv_f = s_csv.fillna(0)
-        s_fab_f = s_fab.fillna(0)
-        
-        # Handle 0 in fabric
-        mask_fab_zero = (s_fab_f == 0)
-        match_fab_zero = (s_csv_f == 0)
-        
-        # Handle standard difference
-        # Use replace(0, np.nan) to avoid division by zero
-        fab_denominator = s_fab_f.replace(0, np.nan)
-        diff_pct = (abs(s_csv_f - s_fab_f) / fab_denominator * 100)
-        match_diff = diff_pct <= self.threshold_percent
-        
-        # Combine
-        results = np.where(mask_na, False, 
-                  np.where(mask_fab_zero, match_fab_zero, match_diff))
-        
-        return pd.Series(results)
+    def validate_and_summarize(self):
+        """Run all validations and build the summary from the counts gathered on the way."""
+        results = self.validate_all()
+        return results, self.get_summary_stats()
+
+    def _segment_records(self, key: str, merged: pd.DataFrame) -> List[Dict]:
+        """Record the segment's pass counts (vectorized) and return its rows as records."""
+        self.segment_counts[key] = (len(merged), int(merged['perfect_match'].sum()))
+        # Same records as to_dict(orient='records'), but boxed a column at a time (tolist) instead of per cell
+        cols = merged.columns.tolist()
+        return [dict(zip(cols, row)) for row in zip(*(merged[c].tolist() for c in cols))]
+
+    def _build_base_aggregates(self):
+        """
+        Sum every metric once per combination of all segment keys on both frames. Each segment
+        then rolls these partial sums up instead of grouping the raw rows again.
+        """
+        keys = [c for c in SEGMENT_KEY_COLUMNS if c in self.csv_df.columns and c in self.fabric_df.columns]
+        metrics = self._get_metrics_list()
+        if not keys or not metrics:
+            return None
+        def base_sums(df):
+            # dropna=False: a row missing e.g. gender still counts towards its day/campaign totals
+            return df.groupby(keys, sort=False, dropna=False, observed=True)[metrics].sum()
+
+        try:
+            # This is the only pass over the raw rows; the two frames are independent, so overlap them
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                csv_base, fab_base = pool.map(base_sums, (self.csv_df, self.fabric_df))
+        except (TypeError, ValueError):
+            return None  # Unhashable/mixed keys - segments group the raw frames (and report as before)
+        return set(keys), csv_base, fab_base
+    
+    def _segment_sums(self, cols, metrics: List[str]):
+        """Per-`cols` sums of `metrics` for both frames, rolled up from the base aggregates when possible."""
+        key_set = {cols} if isinstance(cols, str) else set(cols)
+        if self._base_aggs is not None:
+            base_keys, csv_base, fab_base = self._base_aggs
+            if key_set <= base_keys and all(m in csv_base.columns for m in metrics):
+                # Rows with a missing key drop out here, just like a direct groupby
+                return tuple(
+                    base.groupby(level=cols, sort=False, observed=True)[metrics].sum()
+                    for base in (csv_base, fab_base)
+                )
+        return tuple(
+            df.groupby(cols, sort=False, observed=True)[metrics].sum()
+            for df in (self.csv_df, self.fabric_df)
+        )
+    
+    def _merge_segment(self, cols, metrics: List[str]) -> pd.DataFrame:
+        """Sum `metrics` per `cols` on both frames and outer-join them; a side missing a key counts as 0."""
+        # sort=False: keys are sorted once after the join; observed=True: no empty category combos
+        csv_agg, fab_agg = self._segment_sums(cols, metrics)
+        # Both sides are already indexed by the key, so join on the index instead of re-hashing key columns
+        csv_agg, fab_agg = csv_agg.align(fab_agg, join='outer', axis=0)
+        merged = pd.concat([csv_agg.add_suffix('_csv'), fab_agg.add_suffix('_fab')], axis=1)
+        # Same key order as an outer merge (align leaves identical indexes unsorted)
+        return merged.sort_index().fillna(0).reset_index()
+
+    @staticmethod
+    def _add_diff_pct(merged: pd.DataFrame, metrics: List[str]):
+        """Add `{metric}_diff_pct` columns ((csv - fab) / fab * 100, 2 dp; 0 where fab is 0) in one 2D pass."""
+        csv_arr = merged[[f'{m}_csv' for m in metrics]].to_numpy(dtype=float)
+        fab_arr = merged[[f'{m}_fab' for m in metrics]].to_numpy(dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            diff_pct = ((csv_arr - fab_arr) / fab_arr * 100).round(2)
+        merged[[f'{m}_diff_pct' for m in metrics]] = np.where(fab_arr != 0, diff_pct, 0)
+    
+    def _match_base_metrics(self, merged: pd.DataFrame) -> np.ndarray:
+        """Row passes when cost, impressions and clicks all match within the threshold."""
+        csv_arr = merged[[f'{m}_csv' for m in BASE_MATCH_METRICS]].to_numpy(dtype=float)
+        fab_arr = merged[[f'{m}_fab' for m in BASE_MATCH_METRICS]].to_numpy(dtype=float)
+        return self._fused_match(csv_arr, fab_arr)
+
+    def _fused_match(self, csv_arr: np.ndarray, fab_arr: np.ndarray) -> np.ndarray:
+        """Vectorized _check_match over (rows, metrics) arrays; True where every metric in the row matches."""
+        na = np.isnan(csv_arr) | np.isnan(fab_arr)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            diff_pct = np.abs(csv_arr - fab_arr) / fab_arr * 100
+        # Zero on the Fabric side only matches an exact zero
+        ok = np.where(fab_arr == 0, csv_arr == 0, diff_pct <= self.threshold_percent)
+        return (ok & ~na).all(axis=1)
 
     def _check_match(self, val_csv, val_fabric):
         """Individual scalar match check."""
@@ -413,6 +689,13 @@ class ValidatorEngine:
 
     def _get_metrics_list(self):
         """Get list of ALL numeric columns that exist in both dataframes (DYNAMIC)."""
+        # Every segment asks for this; the dtype scan only needs to run once per validation
+        if self._metrics_cache is None:
+            self._metrics_cache = self._compute_metrics_list()
+        return list(self._metrics_cache)
+    
+    def _compute_metrics_list(self):
+        """Numeric columns present in both frames, key metrics first."""
         # Get numeric columns from both dataframes
         csv_numeric = set(self.csv_df.select_dtypes(include=['int64', 'float64', 'int32', 'float32']).columns)
         fabric_numeric = set(self.fabric_df.select_dtypes(include=['int64', 'float64', 'int32', 'float32']).columns)
@@ -454,6 +737,7 @@ class ValidatorEngine:
                 "diff_pct": round(float(diff_pct), 2),
                 "match": self._check_match(csv_val, fab_val)
             })
+        self.segment_counts["overall"] = (len(comparison), sum(1 for x in comparison if x['match']))
         return comparison
 
     def _validate_by_date(self):
@@ -468,29 +752,14 @@ class ValidatorEngine:
         if 'conversion_value' in self.csv_df.columns and 'conversion_value' in self.fabric_df.columns:
             metrics.append('conversion_value')
         
-        csv_date = self.csv_df.groupby('day')[metrics].sum().reset_index()
-        fab_date = self.fabric_df.groupby('day')[metrics].sum().reset_index()
-        merged = pd.merge(csv_date, fab_date, on='day', how='outer', suffixes=('_csv', '_fab'))
+        merged = self._merge_segment('day', metrics)
         
         # Add diff percentage calculations
-        for metric in metrics:
-            csv_col = f'{metric}_csv'
-            fab_col = f'{metric}_fab'
-            merged[csv_col] = merged[csv_col].fillna(0)
-            merged[fab_col] = merged[fab_col].fillna(0)
-            merged[f'{metric}_diff_pct'] = np.where(
-                merged[fab_col] != 0,
-                ((merged[csv_col] - merged[fab_col]) / merged[fab_col] * 100).round(2),
-                0
-            )
+        self._add_diff_pct(merged, metrics)
         
         # Calculate matches vectorized (only on base metrics for overall pass/fail)
-        merged['perfect_match'] = (
-            self._vectorized_match(merged['cost_csv'], merged['cost_fab']) & 
-            self._vectorized_match(merged['impressions_csv'], merged['impressions_fab']) &
-            self._vectorized_match(merged['clicks_csv'], merged['clicks_fab'])
-        )
-        return merged.to_dict(orient='records')
+        merged['perfect_match'] = self._match_base_metrics(merged)
+        return self._segment_records('by_date', merged)
 
     def _validate_by_campaign(self):
         # Base metrics
@@ -504,156 +773,72 @@ class ValidatorEngine:
         if 'conversion_value' in self.csv_df.columns and 'conversion_value' in self.fabric_df.columns:
             metrics.append('conversion_value')
         
-        csv_camp = self.csv_df.groupby('campaign_name')[metrics].sum().reset_index()
-        fab_camp = self.fabric_df.groupby('campaign_name')[metrics].sum().reset_index()
-        merged = pd.merge(csv_camp, fab_camp, on='campaign_name', how='outer', suffixes=('_csv', '_fab'))
-        
-        # Fill NaN values
-        for metric in metrics:
-            merged[f'{metric}_csv'] = merged[f'{metric}_csv'].fillna(0)
-            merged[f'{metric}_fab'] = merged[f'{metric}_fab'].fillna(0)
+        merged = self._merge_segment('campaign_name', metrics)
         
-        merged['perfect_match'] = (
-            self._vectorized_match(merged['cost_csv'], merged['cost_fab']) & 
-            self._vectorized_match(merged['impressions_csv'], merged['impressions_fab']) &
-            self._vectorized_match(merged['clicks_csv'], merged['clicks_fab'])
-        )
-        return merged.to_dict(orient='records')
+        merged['perfect_match'] = self._match_base_metrics(merged)
+        return self._segment_records('by_campaign', merged)
 
     def _validate_by_platform(self):
         if 'platform' not in self.csv_df.columns: return []
         metrics = self._get_metrics_list()
-        csv_p = self.csv_df.groupby('platform')[metrics].sum().reset_index()
-        fab_p = self.fabric_df.groupby('platform')[metrics].sum().reset_index()
-        merged = pd.merge(csv_p, fab_p, on='platform', how='outer', suffixes=('_csv', '_fab'))
-        
-        for metric in metrics:
-            merged[f'{metric}_csv'] = merged[f'{metric}_csv'].fillna(0)
-            merged[f'{metric}_fab'] = merged[f'{metric}_fab'].fillna(0)
+        merged = self._merge_segment('platform', metrics)
         
-        merged['perfect_match'] = (
-            self._vectorized_match(merged['cost_csv'], merged['cost_fab']) & 
-            self._vectorized_match(merged['impressions_csv'], merged['impressions_fab']) &
-            self._vectorized_match(merged['clicks_csv'], merged['clicks_fab'])
-        )
-        return merged.to_dict(orient='records')
+        merged['perfect_match'] = self._match_base_metrics(merged)
+        return self._segment_records('by_platform', merged)
 
     def _validate_by_placement(self):
         if 'placement' not in self.csv_df.columns: return []
         metrics = self._get_metrics_list()
-        csv_pl = self.csv_df.groupby('placement')[metrics].sum().reset_index()
-        fab_pl = self.fabric_df.groupby('placement')[metrics].sum().reset_index()
-        merged = pd.merge(csv_pl, fab_pl, on='placement', how='outer', suffixes=('_csv', '_fab'))
+        merged = self._merge_segment('placement', metrics)
         
-        for metric in metrics:
-            merged[f'{metric}_csv'] = merged[f'{metric}_csv'].fillna(0)
-            merged[f'{metric}_fab'] = merged[f'{metric}_fab'].fillna(0)
-        
-        merged['perfect_match'] = (
-            self._vectorized_match(merged['cost_csv'], merged['cost_fab']) & 
-            self._vectorized_match(merged['impressions_csv'], merged['impressions_fab']) &
-            self._vectorized_match(merged['clicks_csv'], merged['clicks_fab'])
-        )
-        return merged.to_dict(orient='records')
+        merged['perfect_match'] = self._match_base_metrics(merged)
+        return self._segment_records('by_placement', merged)
 
     def _validate_by_device(self):
         """Validate by device (for Google Ads data)."""
         if 'device' not in self.csv_df.columns: return []
         metrics = self._get_metrics_list()
-        csv_d = self.csv_df.groupby('device')[metrics].sum().reset_index()
-        fab_d = self.fabric_df.groupby('device')[metrics].sum().reset_index()
-        merged = pd.merge(csv_d, fab_d, on='device', how='outer', suffixes=('_csv', '_fab'))
+        merged = self._merge_segment('device', metrics)
         
-        for metric in metrics:
-            merged[f'{metric}_csv'] = merged[f'{metric}_csv'].fillna(0)
-            merged[f'{metric}_fab'] = merged[f'{metric}_fab'].fillna(0)
-        
-        merged['perfect_match'] = (
-            self._vectorized_match(merged['cost_csv'], merged['cost_fab']) & 
-            self._vectorized_match(merged['impressions_csv'], merged['impressions_fab']) &
-            self._vectorized_match(merged['clicks_csv'], merged['clicks_fab'])
-        )
-        return merged.to_dict(orient='records')
+        merged['perfect_match'] = self._match_base_metrics(merged)
+        return self._segment_records('by_device', merged)
 
     def _validate_by_gender(self):
         if 'gender' not in self.csv_df.columns: return []
         metrics = self._get_metrics_list()
-        csv_g = self.csv_df.groupby('gender')[metrics].sum().reset_index()
-        fab_g = self.fabric_df.groupby('gender')[metrics].sum().reset_index()
-        merged = pd.merge(csv_g, fab_g, on='gender', how='outer', suffixes=('_csv', '_fab'))
+        merged = self._merge_segment('gender', metrics)
         
-        for metric in metrics:
-            merged[f'{metric}_csv'] = merged[f'{metric}_csv'].fillna(0)
-            merged[f'{metric}_fab'] = merged[f'{metric}_fab'].fillna(0)
-        
-        merged['perfect_match'] = (
-            self._vectorized_match(merged['cost_csv'], merged['cost_fab']) & 
-            self._vectorized_match(merged['impressions_csv'], merged['impressions_fab']) &
-            self._vectorized_match(merged['clicks_csv'], merged['clicks_fab'])
-        )
-        return merged.to_dict(orient='records')
+        merged['perfect_match'] = self._match_base_metrics(merged)
+        return self._segment_records('by_gender', merged)
 
     def _validate_by_age(self):
         if 'age' not in self.csv_df.columns: return []
         metrics = self._get_metrics_list()
-        csv_a = self.csv_df.groupby('age')[metrics].sum().reset_index()
-        fab_a = self.fabric_df.groupby('age')[metrics].sum().reset_index()
-        merged = pd.merge(csv_a, fab_a, on='age', how='outer', suffixes=('_csv', '_fab'))
-        
-        for metric in metrics:
-            merged[f'{metric}_csv'] = merged[f'{metric}_csv'].fillna(0)
-            merged[f'{metric}_fab'] = merged[f'{metric}_fab'].fillna(0)
+        merged = self._merge_segment('age', metrics)
         
-        merged['perfect_match'] = (
-            self._vectorized_match(merged['cost_csv'], merged['cost_fab']) & 
-            self._vectorized_match(merged['impressions_csv'], merged['impressions_fab']) &
-            self._vectorized_match(merged['clicks_csv'], merged['clicks_fab'])
-        )
-        return merged.to_dict(orient='records')
+        merged['perfect_match'] = self._match_base_metrics(merged)
+        return self._segment_records('by_age', merged)
 
     def _validate_by_camp_date(self):
         cols = ['campaign_name', 'day']
         metrics = self._get_metrics_list()
-        csv_cd = self.csv_df.groupby(cols)[metrics].sum().reset_index()
-        fab_cd = self.fabric_df.groupby(cols)[metrics].sum().reset_index()
-        merged = pd.merge(csv_cd, fab_cd, on=cols, how='outer', suffixes=('_csv', '_fab'))
-        
-        for metric in metrics:
-            merged[f'{metric}_csv'] = merged[f'{metric}_csv'].fillna(0)
-            merged[f'{metric}_fab'] = merged[f'{metric}_fab'].fillna(0)
+        merged = self._merge_segment(cols, metrics)
         
-        merged['perfect_match'] = (
-            self._vectorized_match(merged['cost_csv'], merged['cost_fab']) & 
-            self._vectorized_match(merged['impressions_csv'], merged['impressions_fab']) &
-            self._vectorized_match(merged['clicks_csv'], merged['clicks_fab'])
-        )
-        return merged.to_dict(orient='records')
+        merged['perfect_match'] = self._match_base_metrics(merged)
+        return self._segment_records('by_camp_date', merged)
 
     def _validate_by_campaign_gender(self):
         """Validate by Campaign + Gender (from segment_validation notebooks)."""
         if 'gender' not in self.csv_df.columns: return []
         cols = ['campaign_name', 'gender']
         metrics = self._get_metrics_list()
-        csv_cg = self.csv_df.groupby(cols)[metrics].sum().reset_index()
-        fab_cg = self.fabric_df.groupby(cols)[metrics].sum().reset_index()
-        merged = pd.merge(csv_cg, fab_cg, on=cols, how='outer', suffixes=('_csv', '_fab'))
+        merged = self._merge_segment(cols, metrics)
         
         # Add diff percentage calculations
-        for metric in metrics:
-            merged[f'{metric}_csv'] = merged[f'{metric}_csv'].fillna(0)
-            merged[f'{metric}_fab'] = merged[f'{metric}_fab'].fillna(0)
-            merged[f'{metric}_diff_pct'] = np.where(
-                merged[f'{metric}_fab'] != 0,
-                ((merged[f'{metric}_csv'] - merged[f'{metric}_fab']) / merged[f'{metric}_fab'] * 100).round(2),
-                0
-            )
+        self._add_diff_pct(merged, metrics)
         
-        merged['perfect_match'] = (
-            self._vectorized_match(merged['cost_csv'], merged['cost_fab']) & 
-            self._vectorized_match(merged['impressions_csv'], merged['impressions_fab']) &
-            self._vectorized_match(merged['clicks_csv'], merged['clicks_fab'])
-        )
-        return merged.to_dict(orient='records')
+        merged['perfect_match'] = self._match_base_metrics(merged)
+        return self._segment_records('by_camp_gender', merged)
 
     def _validate_by_date_gender_age(self):
         """Validate by Date + Gender + Age (from segment_validation notebooks)."""
@@ -662,26 +847,13 @@ class ValidatorEngine:
         
         cols = ['day', 'gender', 'age']
         metrics = self._get_metrics_list()
-        csv_dga = self.csv_df.groupby(cols)[metrics].sum().reset_index()
-        fab_dga = self.fabric_df.groupby(cols)[metrics].sum().reset_index()
-        merged = pd.merge(csv_dga, fab_dga, on=cols, how='outer', suffixes=('_csv', '_fab'))
+        merged = self._merge_segment(cols, metrics)
         
         # Add diff percentage calculations
-        for metric in metrics:
-            merged[f'{metric}_csv'] = merged[f'{metric}_csv'].fillna(0)
-            merged[f'{metric}_fab'] = merged[f'{metric}_fab'].fillna(0)
-            merged[f'{metric}_diff_pct'] = np.where(
-                merged[f'{metric}_fab'] != 0,
-                ((merged[f'{metric}_csv'] - merged[f'{metric}_fab']) / merged[f'{metric}_fab'] * 100).round(2),
-                0
-            )
+        self._add_diff_pct(merged, metrics)
         
-        merged['perfect_match'] = (
-            self._vectorized_match(merged['cost_csv'], merged['cost_fab']) & 
-            self._vectorized_match(merged['impressions_csv'], merged['impressions_fab']) &
-            self._vectorized_match(merged['clicks_csv'], merged['clicks_fab'])
-        )
-        return merged.to_dict(orient='records')
+        merged['perfect_match'] = self._match_base_metrics(merged)
+        return self._segment_records('by_date_gender_age', merged)
 
     def get_summary_stats(self):
         """Generates high level stats for the dashboard cards."""
@@ -692,7 +864,11 @@ class ValidatorEngine:
         
         summary = []
         for key, data in self.raw_results.items():
-            if key == "overall":
+            if key in self.segment_counts:
+                # Counted while the segment was validated - no need to re-scan the records
+                total, matches = self.segment_counts[key]
+            elif key == "overall":
+                # raw_results restored without a validation run
                 matches = sum(1 for x in data if x['match'])
                 total = len(data)
             else:
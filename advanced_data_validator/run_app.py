@@ -3,10 +3,21 @@
 NYX Data Validator - Quick Start Script
 Run this file to start the application: python run_app.py
 """
+import importlib.util
 import os
 import sys
 import subprocess
 
+# Written when neither .env nor .env.example exists
+BASIC_ENV_TEMPLATE = """# NYX Data Validator Configuration
+GOOGLE_API_KEY=your_api_key_here
+AUTH_USER1_USERNAME=admin
+AUTH_USER1_PASSWORD=admin123
+AUTH_USER2_USERNAME=validator
+AUTH_USER2_PASSWORD=valid123
+JWT_SECRET_KEY=nyx-data-validator-secret-key-2024
+"""
+
 def main():
     # Change to backend directory
     backend_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend')
@@ -27,24 +38,17 @@ def main():
         else:
             print("❌ No .env.example found. Creating basic .env...")
             with open('.env', 'w') as f:
-                f.write("# NYX Data Validator Configuration\n")
-                f.write("GOOGLE_API_KEY=your_api_key_here\n")
-                f.write("AUTH_USER1_USERNAME=admin\n")
-                f.write("AUTH_USER1_PASSWORD=admin123\n")
-                f.write("AUTH_USER2_USERNAME=validator\n")
-                f.write("AUTH_USER2_PASSWORD=valid123\n")
-                f.write("JWT_SECRET_KEY=nyx-data-validator-secret-key-2024\n")
+                f.write(BASIC_ENV_TEMPLATE)
     
     # Install dependencies if needed
     print("📦 Checking dependencies...")
-    try:
-        import uvicorn
-        import fastapi
-        print("✅ Dependencies OK")
-    except ImportError:
+    # find_spec only locates the packages; uvicorn is imported once, right before it runs
+    if importlib.util.find_spec("uvicorn") is None or importlib.util.find_spec("fastapi") is None:
         print("📥 Installing dependencies...")
         subprocess.run([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"], check=True)
         print("✅ Dependencies installed")
+    else:
+        print("✅ Dependencies OK")
     
     print()
     print("🌐 Server starting at: http://localhost:8000")
@@ -53,13 +57,18 @@ def main():
     print()
     print("=" * 60)
     
-    # Run uvicorn
+    # Run uvicorn (uvicorn[standard] brings uvloop + httptools, which it picks automatically)
     import uvicorn
+    from dotenv import load_dotenv
+    load_dotenv()
+    # More than one worker needs SESSION_BACKEND=redis so every worker sees every session
+    workers = int(os.getenv("UVICORN_WORKERS", 1))
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=False
+        reload=False,
+        workers=workers
     )
 
 if __name__ == "__main__":